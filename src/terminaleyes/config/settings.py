@@ -6,6 +6,8 @@ overrides for sensitive values (API keys). Supports .env files.
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
 import os
 from pathlib import Path
@@ -144,11 +146,34 @@ class Settings(BaseSettings):
     watch: WatchConfig = Field(default_factory=WatchConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
 
+    @classmethod
+    def defaults(cls) -> Settings:
+        """In-code default settings, built once and copied per call.
+
+        model_construct fills field defaults without running
+        pydantic-core validation or the env/.env sources, so unlike
+        ``Settings()`` the result is deterministic regardless of the
+        caller's environment — use it for tests and dry-runs that want
+        the pure code defaults. The cached instance is deep-copied on
+        the way out (sub-configs are mutable models) so callers can't
+        mutate it for each other; the copy still skips validation.
+        """
+        cached = cls.__dict__.get("_defaults_cache")
+        if cached is None:
+            cached = cls.model_construct()
+            cls._defaults_cache = cached
+        return cached.model_copy(deep=True)
+
 
 def load_settings(config_path: Path | str | None = None) -> Settings:
     """Load settings from YAML + .env + environment variables.
 
     Priority: env vars > .env file > YAML file > defaults
+
+    Repeat loads within a process are served from an mtime-keyed parse
+    cache; no on-disk cache is kept (a serialized-Settings sidecar
+    would write resolved API keys to disk, and a cold parse of a
+    config this size is sub-millisecond anyway).
     """
     path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
 
@@ -157,8 +182,14 @@ def load_settings(config_path: Path | str | None = None) -> Settings:
 
     yaml_data = {}
     if path.exists():
-        with open(path) as f:
-            yaml_data = yaml.safe_load(f) or {}
+        # The parse is cached keyed on (path, mtime), so repeated
+        # loads of an unchanged file skip the YAML walk entirely; a
+        # deepcopy keeps the cached tree safe from the env-override
+        # mutation below. Env handling stays outside the cache so
+        # variable changes between calls are still honored.
+        yaml_data = copy.deepcopy(
+            _parse_yaml_cached(str(path), path.stat().st_mtime)
+        )
         logger.info("Loaded configuration from %s", path)
     else:
         logger.warning("Config file %s not found, using defaults + env vars", path)
@@ -169,6 +200,18 @@ def load_settings(config_path: Path | str | None = None) -> Settings:
     return Settings(**yaml_data)
 
 
+# LibYAML's C scanner when the wheel ships it; same safe-load semantics
+# either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_cached(path_str: str, mtime: float) -> dict:
+    """Parse a YAML config file, memoized on path and mtime."""
+    with open(path_str) as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
 def _load_dotenv() -> None:
     """Load .env file into os.environ if it exists."""
     env_path = Path(".env")
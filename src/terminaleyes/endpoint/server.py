@@ -14,6 +14,7 @@ from typing import AsyncIterator
 
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from terminaleyes.endpoint.display import TerminalDisplay
@@ -35,6 +36,17 @@ class TextInputRequest(BaseModel):
     text: str = Field(description="Text to type")
 
 
+class BatchAction(BaseModel):
+    op: str = Field(description="Action type: 'key', 'combo', or 'text'")
+    key: str | None = Field(default=None, description="Key name for 'key'/'combo'")
+    modifiers: list[str] = Field(default_factory=list, description="Modifiers for 'combo'")
+    text: str | None = Field(default=None, description="Text for 'text'")
+
+
+class BatchRequest(BaseModel):
+    actions: list[BatchAction] = Field(description="Actions executed in order")
+
+
 class EndpointStatus(BaseModel):
     status: str = "ok"
     shell_alive: bool = True
@@ -79,12 +91,19 @@ def create_app(
     fullscreen: bool = True,
     window_x: int | None = None,
     window_y: int | None = None,
+    thread_limit: int = 100,
 ) -> FastAPI:
     """Create and configure the FastAPI application."""
 
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         # Startup
+        # AnyIO's default worker pool is 40 threads; long-lived pty reads and
+        # sync dependencies each pin a slot, which can starve /screen handlers
+        # under keystroke bursts. Raise the ceiling before serving.
+        import anyio
+
+        anyio.to_thread.current_default_thread_limiter().total_tokens = thread_limit
         s = app.state.shell
         d = app.state.display
         if s is None:
@@ -119,6 +138,7 @@ def create_app(
         description="Local HTTP command endpoint for the terminaleyes agent",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     app.state.shell = shell
@@ -167,6 +187,23 @@ def create_app(
         await s.send_input(request.text)
         return {"status": "ok", "length": str(len(request.text))}
 
+    @app.post("/batch")
+    async def receive_batch(request: BatchRequest) -> dict[str, str]:
+        # One POST for N actions — send_line and friends batch through
+        # here instead of paying a round trip per keystroke.
+        for action in request.actions:
+            if action.op == "key" and action.key is not None:
+                await receive_keystroke(KeystrokeRequest(key=action.key))
+            elif action.op == "combo" and action.key is not None:
+                await receive_key_combo(
+                    KeyComboRequest(modifiers=action.modifiers, key=action.key)
+                )
+            elif action.op == "text" and action.text is not None:
+                await receive_text(TextInputRequest(text=action.text))
+            else:
+                return {"status": "ignored", "reason": f"Invalid batch action: {action.op}"}
+        return {"status": "ok", "actions": str(len(request.actions))}
+
     @app.get("/screen")
     async def get_screen_content() -> dict[str, str]:
         s: PersistentShell = app.state.shell
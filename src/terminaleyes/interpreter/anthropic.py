@@ -9,7 +9,7 @@ from __future__ import annotations
 import logging
 
 from terminaleyes.domain.models import CapturedFrame, TerminalState
-from terminaleyes.interpreter.base import MLLMError, MLLMProvider
+from terminaleyes.interpreter.base import MLLMError, MLLMProvider, make_pooled_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -52,16 +52,31 @@ class AnthropicProvider(MLLMProvider):
         self._api_key = api_key
         self._max_tokens = max_tokens
         self._client: object | None = None  # Will be anthropic.AsyncAnthropic
+        self._http_client: object | None = None
 
     async def _ensure_client(self) -> None:
         """Lazily initialize the Anthropic async client.
 
-        TODO: Implement the following:
-            1. Import anthropic
-            2. Create anthropic.AsyncAnthropic(api_key=self._api_key)
-            3. Store in self._client
+        Hands the SDK a pooled (HTTP/2-capable) httpx client so concurrent
+        interpret() calls reuse connections instead of paying a TCP+TLS
+        handshake each.
         """
-        raise NotImplementedError("TODO: Initialize Anthropic client")
+        if self._client is not None:
+            return
+        import anthropic
+
+        self._http_client = make_pooled_http_client()
+        self._client = anthropic.AsyncAnthropic(
+            api_key=self._api_key, http_client=self._http_client
+        )
+        logger.info("Initialized Anthropic client (model=%s)", self._model)
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()  # type: ignore[attr-defined]
+            self._http_client = None
+            self._client = None
 
     async def interpret(self, frame: CapturedFrame) -> TerminalState:
         """Interpret a terminal screenshot using Claude's vision API.
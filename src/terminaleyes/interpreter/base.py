@@ -7,10 +7,13 @@ rest of the pipeline.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime
 
 from terminaleyes.domain.models import (
@@ -19,10 +22,32 @@ from terminaleyes.domain.models import (
     TerminalReadiness,
     TerminalState,
 )
-from terminaleyes.utils.imaging import enhance_for_ocr, numpy_to_base64_png, resize_for_mllm
+from terminaleyes.utils.imaging import (
+    enhance_for_ocr,
+    numpy_to_base64_png,
+    numpy_to_png_bytes,
+    resize_for_mllm,
+)
 
 logger = logging.getLogger(__name__)
 
+try:
+    # C-accelerated parsing; the well-formed-JSON fast path below goes
+    # through this on every frame.
+    import orjson
+
+    _fast_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _fast_loads = json.loads
+
+# Bound once; skips the module-attribute + descriptor lookup per frame.
+_now = datetime.now
+
+# String -> enum without the exception machinery: unexpected readiness
+# values from the model are common during calibration, and a dict miss is
+# far cheaper than a raised ValueError.
+_READINESS_MAP = {m.value: m for m in TerminalReadiness}
+
 
 DEFAULT_SYSTEM_PROMPT = """You are a terminal screen interpreter. You are given a screenshot of a terminal window.
 
@@ -50,6 +75,64 @@ Respond ONLY with valid JSON in the following format (no markdown, no explanatio
 }
 """
 
+# Encoded once at import time. The default prompt is a static ~1KB string
+# that otherwise gets re-encoded to UTF-8 on every request-body build;
+# providers that construct raw HTTP payloads should reach for the cached
+# bytes via `system_prompt_bytes` instead.
+_DEFAULT_SYSTEM_PROMPT_BYTES = DEFAULT_SYSTEM_PROMPT.encode()
+
+
+# JSON schema of the interpretation payload, for providers that use
+# constrained decoding (function calling / structured outputs). Mirrors
+# the shape documented in DEFAULT_SYSTEM_PROMPT.
+TERMINAL_STATE_JSON_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "visible_text": {"type": "string"},
+        "last_command": {"type": ["string", "null"]},
+        "last_output": {"type": ["string", "null"]},
+        "prompt_text": {"type": ["string", "null"]},
+        "error_messages": {"type": "array", "items": {"type": "string"}},
+        "working_directory": {"type": ["string", "null"]},
+        "readiness": {"type": "string", "enum": ["ready", "busy", "error", "unknown"]},
+        "confidence": {"type": "number"},
+    },
+    "required": ["visible_text", "readiness", "confidence"],
+}
+
+# Fields _scan_fields_once / _extract_fields_fallback know how to recover
+# from malformed responses. Anything else in the payload is ignored.
+_KNOWN_FIELDS = frozenset(
+    {
+        "visible_text",
+        "last_command",
+        "last_output",
+        "prompt_text",
+        "error_messages",
+        "working_directory",
+        "readiness",
+        "confidence",
+    }
+)
+
+
+def make_pooled_http_client() -> object:
+    """Build an httpx.AsyncClient tuned for concurrent MLLM calls.
+
+    Connection pooling (and HTTP/2 when the `h2` extra is installed)
+    amortizes the TCP+TLS handshake across interpret() calls instead of
+    paying it per request. Providers hand this to their SDK client and
+    own its lifetime (close it in `close()`).
+    """
+    import httpx
+
+    limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    try:
+        return httpx.AsyncClient(http2=True, limits=limits)
+    except ImportError:
+        # h2 not installed; pooled HTTP/1.1 still avoids per-call handshakes.
+        return httpx.AsyncClient(limits=limits)
+
 
 class MLLMProvider(ABC):
     """Abstract interface for multimodal LLM providers."""
@@ -57,11 +140,28 @@ class MLLMProvider(ABC):
     def __init__(self, model: str, system_prompt: str | None = None) -> None:
         self._model = model
         self._system_prompt = system_prompt or DEFAULT_SYSTEM_PROMPT
+        # Reuse the import-time encoding for the (common) default-prompt case.
+        self._system_prompt_bytes = (
+            _DEFAULT_SYSTEM_PROMPT_BYTES
+            if self._system_prompt is DEFAULT_SYSTEM_PROMPT
+            else self._system_prompt.encode()
+        )
+        # LRU of content-hash -> base64 PNG; see _encode_frame_to_base64.
+        # Providers may offload the encode to worker threads, so the
+        # OrderedDict bookkeeping is guarded by a lock (OrderedDict
+        # mutation is not thread-safe).
+        self._b64_cache: OrderedDict[bytes, str] = OrderedDict()
+        self._b64_lock = threading.Lock()
 
     @property
     def model(self) -> str:
         return self._model
 
+    @property
+    def system_prompt_bytes(self) -> bytes:
+        """UTF-8 bytes of the system prompt, encoded once per provider."""
+        return self._system_prompt_bytes
+
     @abstractmethod
     async def interpret(self, frame: CapturedFrame) -> TerminalState:
         """Interpret a captured terminal frame using the MLLM."""
@@ -72,30 +172,79 @@ class MLLMProvider(ABC):
         """Check if the MLLM provider is reachable and authenticated."""
         ...
 
+    async def close(self) -> None:
+        """Release any pooled HTTP resources. Default is a no-op."""
+
+    # Consecutive terminal frames are frequently pixel-identical; a handful
+    # of cached encodings covers the common idle-screen case.
+    _B64_CACHE_MAX = 8
+
     def _encode_frame_to_base64(self, frame: CapturedFrame) -> str:
         """Encode a captured frame's image to a base64 PNG string.
 
         Applies OCR enhancement (binarization, contrast) before resizing
-        to improve MLLM text recognition accuracy.
+        to improve MLLM text recognition accuracy. Encodings are cached
+        keyed on a content hash of the resized pixels, so duplicate frames
+        skip the PNG encode + base64 entirely.
         """
         enhanced = enhance_for_ocr(frame.image)
         resized = resize_for_mllm(enhanced)
-        return numpy_to_base64_png(resized)
+        key = hashlib.blake2b(resized.tobytes(), digest_size=16).digest()
+        # Only the cache bookkeeping is locked; the cv2/hash work above
+        # and the PNG+base64 encode below run unguarded so concurrent
+        # encodes still overlap.
+        with self._b64_lock:
+            cached = self._b64_cache.get(key)
+            if cached is not None:
+                self._b64_cache.move_to_end(key)
+                return cached
+        b64 = numpy_to_base64_png(resized)
+        with self._b64_lock:
+            self._b64_cache[key] = b64
+            if len(self._b64_cache) > self._B64_CACHE_MAX:
+                self._b64_cache.popitem(last=False)
+        return b64
+
+    def _frame_to_png(self, frame: CapturedFrame) -> tuple[str, bytes]:
+        """Enhance + resize a frame and return (content-hash hex, PNG bytes).
+
+        Same preprocessing pipeline as _encode_frame_to_base64, but
+        without the base64 step — for providers that ship the raw PNG to
+        a content-addressed image cache instead of inlining a data URL.
+        """
+        enhanced = enhance_for_ocr(frame.image)
+        resized = resize_for_mllm(enhanced)
+        key = hashlib.blake2b(resized.tobytes(), digest_size=16).hexdigest()
+        return key, numpy_to_png_bytes(resized)
 
     def _parse_response(self, raw_response: str, frame: CapturedFrame) -> TerminalState:
         """Parse a raw MLLM response string into a TerminalState."""
-        # Try to extract JSON from markdown code blocks or raw text
+        # Fast path: JSON-mode responses are already valid JSON, so try a
+        # straight C-accelerated parse before any extraction work.
+        try:
+            data = _fast_loads(raw_response)
+            if isinstance(data, dict):
+                return self._build_state(data, raw_response, frame)
+        except ValueError:
+            pass
+
+        # Extract JSON from markdown code blocks or raw text. Responses are
+        # either bare JSON or wrapped in a single ``` fence, so a couple of
+        # find/rfind calls beat regex scans of the full string.
         json_str = raw_response.strip()
 
         # Remove markdown code block if present
-        match = re.search(r"```(?:json)?\s*(.*?)```", json_str, re.DOTALL)
-        if match:
-            json_str = match.group(1).strip()
-
-        # Try to find JSON object in the text
-        brace_match = re.search(r"\{.*\}", json_str, re.DOTALL)
-        if brace_match:
-            json_str = brace_match.group(0)
+        if json_str.startswith("```"):
+            first_nl = json_str.find("\n")
+            closing = json_str.rfind("```")
+            if first_nl != -1 and closing > first_nl:
+                json_str = json_str[first_nl + 1 : closing].strip()
+
+        # Narrow to the outermost JSON object in the text
+        lo = json_str.find("{")
+        hi = json_str.rfind("}")
+        if lo != -1 and hi > lo:
+            json_str = json_str[lo : hi + 1]
 
         data = None
         try:
@@ -120,22 +269,43 @@ class MLLMProvider(ABC):
                 raw_response=raw_response,
             )
 
+        return self._build_state(data, raw_response, frame)
+
+    def _parse_structured(self, arguments: str, frame: CapturedFrame) -> TerminalState:
+        """Parse constrained-decoder output (tool-call arguments).
+
+        The producer guarantees shape, so this is a straight parse with
+        none of _parse_response's fence-stripping or field recovery.
+        """
         try:
+            data = _fast_loads(arguments)
+        except ValueError as e:
+            raise MLLMError(
+                f"Failed to parse structured MLLM response: {e}",
+                provider=type(self).__name__,
+                raw_response=arguments,
+            ) from e
+        return self._build_state(data, arguments, frame)
+
+    def _build_state(
+        self, data: dict, raw_response: str, frame: CapturedFrame
+    ) -> TerminalState:
+        """Build a TerminalState from a parsed response dict."""
+        try:
+            # Bind the bound method once; ten .get calls otherwise each
+            # pay the descriptor lookup in the hottest interpret code.
+            g = data.get
             content = TerminalContent(
-                visible_text=data.get("visible_text", ""),
-                last_command=data.get("last_command"),
-                last_output=data.get("last_output"),
-                prompt_text=data.get("prompt_text"),
-                error_messages=data.get("error_messages", []),
-                working_directory=data.get("working_directory"),
+                visible_text=g("visible_text", ""),
+                last_command=g("last_command"),
+                last_output=g("last_output"),
+                prompt_text=g("prompt_text"),
+                error_messages=g("error_messages", []),
+                working_directory=g("working_directory"),
             )
-            readiness_str = data.get("readiness", "unknown")
-            try:
-                readiness = TerminalReadiness(readiness_str)
-            except ValueError:
-                readiness = TerminalReadiness.UNKNOWN
+            readiness = _READINESS_MAP.get(g("readiness", "unknown"), TerminalReadiness.UNKNOWN)
 
-            confidence = float(data.get("confidence", 0.5))
+            confidence = float(g("confidence", 0.5))
             confidence = max(0.0, min(1.0, confidence))
 
             return TerminalState(
@@ -143,7 +313,7 @@ class MLLMProvider(ABC):
                 readiness=readiness,
                 confidence=confidence,
                 raw_interpretation=raw_response,
-                timestamp=datetime.now(),
+                timestamp=_now(),
                 frame_number=frame.frame_number,
             )
         except Exception as e:
@@ -154,9 +324,83 @@ class MLLMProvider(ABC):
             ) from e
 
 
+    @staticmethod
+    def _scan_fields_once(raw: str) -> dict | None:
+        """Recover known fields from malformed JSON in a single pass.
+
+        Walks the response once, escape-aware, looking for `"key":` pairs
+        whose key is one of the fields we know how to use, then parses just
+        the value with ``raw_decode`` (which only consumes that value). This
+        keeps recovery O(N) on large responses instead of one full regex
+        sweep per field. Returns None when nothing usable was found so the
+        regex fallback can take over.
+        """
+        decoder = json.JSONDecoder()
+        fields: dict = {}
+        n = len(raw)
+        i = 0
+        while i < n:
+            if raw[i] != '"':
+                i += 1
+                continue
+            # Read one JSON string (escape-aware).
+            j = i + 1
+            while j < n:
+                c = raw[j]
+                if c == "\\":
+                    j += 2
+                    continue
+                if c == '"':
+                    break
+                j += 1
+            if j >= n:
+                break
+            key = raw[i + 1 : j]
+            i = j + 1
+            if key not in _KNOWN_FIELDS or key in fields:
+                continue
+            # A key is only a key if a colon follows; otherwise it was a value.
+            k = i
+            while k < n and raw[k] in " \t\r\n":
+                k += 1
+            if k >= n or raw[k] != ":":
+                continue
+            k += 1
+            while k < n and raw[k] in " \t\r\n":
+                k += 1
+            if k >= n:
+                break
+            try:
+                value, end = decoder.raw_decode(raw, k)
+            except json.JSONDecodeError:
+                # Unparseable value (bad escapes, truncation) — leave it for
+                # the regex fallback and keep scanning from the colon.
+                continue
+            fields[key] = value
+            i = end
+
+        if not fields:
+            return None
+        fields.setdefault("visible_text", raw[:500])
+        if not isinstance(fields.get("error_messages"), list):
+            fields["error_messages"] = []
+        return fields
+
     @staticmethod
     def _extract_fields_fallback(raw: str) -> dict | None:
-        """Extract fields from malformed JSON using regex."""
+        """Extract fields from malformed JSON.
+
+        Tries the single-pass scanner first; falls back to per-field regex
+        extraction only when the scanner finds nothing.
+        """
+        fields = MLLMProvider._scan_fields_once(raw)
+        if fields is not None:
+            return fields
+        return MLLMProvider._extract_fields_regex(raw)
+
+    @staticmethod
+    def _extract_fields_regex(raw: str) -> dict | None:
+        """Last-resort field extraction from malformed JSON using regex."""
         try:
             fields = {}
             # Extract visible_text
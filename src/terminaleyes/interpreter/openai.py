@@ -6,14 +6,46 @@ by setting a custom base_url.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import uuid
 
 from terminaleyes.domain.models import CapturedFrame, TerminalState
-from terminaleyes.interpreter.base import MLLMError, MLLMProvider
+from terminaleyes.interpreter.base import (
+    TERMINAL_STATE_JSON_SCHEMA,
+    MLLMError,
+    MLLMProvider,
+    make_pooled_http_client,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _shared_http_client() -> object:
+    """One pooled httpx client shared by every OpenAI provider instance."""
+    return make_pooled_http_client()
+
+
+@functools.cache
+def _shared_client(api_key: str, base_url: str | None) -> object:
+    """One AsyncOpenAI per (api_key, base_url), shared across providers.
+
+    Retry and fallback providers built with the same credentials reuse
+    the same connection pool / TLS session instead of each opening
+    their own.
+    """
+    from openai import AsyncOpenAI
+
+    kwargs = {"api_key": api_key}
+    if base_url:
+        kwargs["base_url"] = base_url
+    client = AsyncOpenAI(http_client=_shared_http_client(), **kwargs)
+    logger.info("Initialized OpenAI client (base_url=%s)", base_url)
+    return client
+
+
 class OpenAIProvider(MLLMProvider):
     """MLLM provider using OpenAI's chat completions API.
 
@@ -27,56 +59,148 @@ class OpenAIProvider(MLLMProvider):
         base_url: str | None = None,
         system_prompt: str | None = None,
         max_tokens: int = 1024,
+        image_cache_url: str | None = None,
+        use_tools: bool = False,
     ) -> None:
         super().__init__(model=model, system_prompt=system_prompt)
         self._api_key = api_key
         self._base_url = base_url
         self._max_tokens = max_tokens
+        # Optional content-addressed image cache (self-hosted / gateway
+        # setups). When set, frames are PUT once as raw PNG and referenced
+        # by URL, skipping the base64 encode and its 33% wire inflation.
+        self._image_cache_url = image_cache_url.rstrip("/") if image_cache_url else None
+        self._uploaded_keys: set[str] = set()
+        # Opt-in function calling: the server's constrained decoder emits
+        # guaranteed-shape JSON, so parsing skips all recovery logic.
+        # Off by default — not every OpenAI-compatible server supports it.
+        self._use_tools = use_tools
+        self._tools = [
+            {
+                "type": "function",
+                "function": {
+                    "name": "report",
+                    "description": "Report the structured terminal interpretation.",
+                    "parameters": TERMINAL_STATE_JSON_SCHEMA,
+                },
+            }
+        ]
+        self._tool_choice = {"type": "function", "function": {"name": "report"}}
         self._client = None
+        self._http_client = None
+        # Server-side prefix caches key on an identical leading system
+        # message (plus a stable user/session hint), so build the system
+        # message once and reuse the same object every call.
+        self._system_message = {"role": "system", "content": self._system_prompt}
+        self._session_id = f"terminaleyes-{uuid.uuid4().hex[:12]}"
+        # The instruction part never changes either; only the image URL is
+        # rebuilt per call, so each interpret() allocates two small dicts
+        # instead of the full five-dict message tree.
+        self._text_part = {
+            "type": "text",
+            "text": "Interpret this terminal screenshot.",
+        }
 
     async def _ensure_client(self) -> None:
-        """Lazily initialize the OpenAI async client."""
+        """Lazily bind the shared OpenAI async client."""
         if self._client is not None:
             return
-        from openai import AsyncOpenAI
-        kwargs = {"api_key": self._api_key}
-        if self._base_url:
-            kwargs["base_url"] = self._base_url
-        self._client = AsyncOpenAI(**kwargs)
-        logger.info("Initialized OpenAI client (model=%s, base_url=%s)", self._model, self._base_url)
+        self._client = _shared_client(self._api_key, self._base_url)
+        self._http_client = _shared_http_client()
+
+    async def close(self) -> None:
+        """Drop this provider's client references.
+
+        The connection pool is shared process-wide across providers, so
+        it is deliberately left open here; it lives for the process.
+        """
+        self._http_client = None
+        self._client = None
+
+    async def _upload_frame_and_get_url(self, frame: CapturedFrame) -> str:
+        """PUT the frame's PNG to the image cache and return its URL.
+
+        The cache is content-addressed, so an already-uploaded frame
+        (tracked by hash) costs nothing but the URL string.
+        """
+        key, png = self._frame_to_png(frame)
+        url = f"{self._image_cache_url}/img/{key}.png"
+        if key not in self._uploaded_keys:
+            resp = await self._http_client.put(
+                url, content=png, headers={"content-type": "image/png"}
+            )
+            resp.raise_for_status()
+            self._uploaded_keys.add(key)
+        return url
 
     async def interpret(self, frame: CapturedFrame) -> TerminalState:
         """Interpret a terminal screenshot using the vision API."""
-        await self._ensure_client()
-        b64_image = self._encode_frame_to_base64(frame)
+        if self._image_cache_url is not None:
+            await self._ensure_client()
+            image_url = await self._upload_frame_and_get_url(frame)
+        else:
+            # PNG encode is CPU-bound; run it in a worker thread so it
+            # overlaps client setup and doesn't stall the event loop
+            # (concurrent frames keep flowing during the encode).
+            encode_task = asyncio.create_task(
+                asyncio.to_thread(self._encode_frame_to_base64, frame)
+            )
+            try:
+                await self._ensure_client()
+            except BaseException:
+                # Don't orphan the encode: cancellation can't interrupt
+                # the worker thread mid-encode, so await the task out
+                # before re-raising the client error.
+                encode_task.cancel()
+                try:
+                    await encode_task
+                except BaseException:
+                    pass
+                raise
+            b64_image = await encode_task
+            image_url = f"data:image/png;base64,{b64_image}"
 
         messages = [
-            {"role": "system", "content": self._system_prompt},
+            self._system_message,
             {
                 "role": "user",
                 "content": [
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/png;base64,{b64_image}",
+                            "url": image_url,
                             "detail": "high",
                         },
                     },
-                    {
-                        "type": "text",
-                        "text": "Interpret this terminal screenshot.",
-                    },
+                    self._text_part,
                 ],
             },
         ]
 
+        kwargs: dict = {
+            "model": self._model,
+            "max_tokens": self._max_tokens,
+            "messages": messages,
+            # Stable session id lets OpenAI-compatible servers route
+            # repeat calls to the same prefix-cache shard.
+            "user": self._session_id,
+        }
+        if self._use_tools:
+            kwargs["tools"] = self._tools
+            kwargs["tool_choice"] = self._tool_choice
+        else:
+            # JSON mode: guarantees parseable output so the parser's
+            # fast path never falls back to extraction.
+            kwargs["response_format"] = {"type": "json_object"}
+
         try:
-            response = await self._client.chat.completions.create(
-                model=self._model,
-                max_tokens=self._max_tokens,
-                messages=messages,
-            )
-            raw_text = response.choices[0].message.content
+            response = await self._client.chat.completions.create(**kwargs)
+            message = response.choices[0].message
+            if self._use_tools and message.tool_calls:
+                args = message.tool_calls[0].function.arguments
+                logger.debug("MLLM tool-call response: %s", args[:200])
+                return self._parse_structured(args, frame)
+            raw_text = message.content
             logger.debug("MLLM raw response: %s", raw_text[:200])
             return self._parse_response(raw_text, frame)
         except Exception as e:
@@ -9,18 +9,25 @@ any other code.
 from __future__ import annotations
 
 import logging
-from abc import ABC, abstractmethod
+from typing import Protocol, runtime_checkable
 
 logger = logging.getLogger(__name__)
 
 
-class KeyboardOutput(ABC):
-    """Abstract interface for sending keyboard actions to a target.
+@runtime_checkable
+class KeyboardOutput(Protocol):
+    """Structural interface for sending keyboard actions to a target.
 
     Implementations translate logical keyboard actions (keystrokes,
     key combinations, text input) into the appropriate protocol for
     their target (HTTP requests, USB HID reports, etc.).
 
+    A Protocol rather than an ABC: backends are dispatched tens to
+    hundreds of times per second, and the structural form avoids
+    ABCMeta per-call overhead while letting concrete backends declare
+    __slots__. Explicit subclassing still works and inherits the
+    default send_line / context-manager implementations.
+
     Example usage::
 
         async with HttpKeyboardOutput(base_url="http://localhost:8080") as kb:
@@ -29,7 +36,8 @@ class KeyboardOutput(ABC):
             await kb.send_key_combo(["ctrl"], "c")
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     async def connect(self) -> None:
         """Establish connection to the keyboard output target.
 
@@ -44,7 +52,6 @@ class KeyboardOutput(ABC):
         """
         ...
 
-    @abstractmethod
     async def disconnect(self) -> None:
         """Close the connection to the output target.
 
@@ -55,7 +62,6 @@ class KeyboardOutput(ABC):
         """
         ...
 
-    @abstractmethod
     async def send_keystroke(self, key: str) -> None:
         """Send a single key press.
 
@@ -74,7 +80,6 @@ class KeyboardOutput(ABC):
         """
         ...
 
-    @abstractmethod
     async def send_key_combo(self, modifiers: list[str], key: str) -> None:
         """Send a key combination (modifier keys + main key).
 
@@ -95,7 +100,6 @@ class KeyboardOutput(ABC):
         """
         ...
 
-    @abstractmethod
     async def send_text(self, text: str) -> None:
         """Type a string of text character by character.
 
@@ -13,10 +13,27 @@ from terminaleyes.keyboard.base import KeyboardOutput, KeyboardOutputError
 
 logger = logging.getLogger(__name__)
 
+try:
+    # C-accelerated serialization for the per-POST hot path; multi-KB
+    # send_text payloads otherwise go through stdlib json.dumps.
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover
+    import json
+
+    def _dumps(payload: dict) -> bytes:
+        return json.dumps(payload).encode()
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
 
 class HttpKeyboardOutput(KeyboardOutput):
     """Sends keyboard actions to the local HTTP command endpoint."""
 
+    __slots__ = ("_base_url", "_timeout", "_transport", "_prefix", "_client")
+
     def __init__(
         self,
         base_url: str = "http://localhost:8080",
@@ -30,11 +47,28 @@ class HttpKeyboardOutput(KeyboardOutput):
         self._client: httpx.AsyncClient | None = None
 
     async def connect(self) -> None:
-        """Create the HTTP client and verify endpoint connectivity."""
-        self._client = httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=self._timeout,
-        )
+        """Create the HTTP client and verify endpoint connectivity.
+
+        The client keeps one warm connection alive for the session
+        (HTTP/2 when the h2 extra is installed) so each POST rides an
+        existing stream instead of paying a handshake — the per-keystroke
+        cost that matters on the remote-Pi link.
+        """
+        limits = httpx.Limits(max_keepalive_connections=1, keepalive_expiry=300.0)
+        try:
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=self._timeout,
+                http2=True,
+                limits=limits,
+            )
+        except ImportError:
+            # h2 not installed; keepalive on HTTP/1.1 still reuses the socket.
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                timeout=self._timeout,
+                limits=limits,
+            )
         try:
             resp = await self._client.get("/health")
             resp.raise_for_status()
@@ -87,12 +121,31 @@ class HttpKeyboardOutput(KeyboardOutput):
         else:
             logger.debug("Sent text: %s", text[:50])
 
+    async def send_actions(self, actions: list[dict]) -> None:
+        """Send a sequence of keyboard actions in a single POST.
+
+        Each action is a dict with an ``op`` of ``"key"``, ``"combo"`` or
+        ``"text"`` plus that op's fields (``key``, ``modifiers``, ``text``,
+        ``warmup``). The endpoint executes them in order, so N actions cost
+        one HTTP round trip instead of N.
+        """
+        await self._post(f"{self._prefix}/batch", {"actions": actions})
+        logger.debug("Sent action batch (n=%d)", len(actions))
+
+    async def send_line(self, text: str) -> None:
+        """Type a string of text and press Enter in one round trip."""
+        await self.send_actions(
+            [{"op": "text", "text": text}, {"op": "key", "key": "Enter"}]
+        )
+
     async def _post(self, path: str, payload: dict) -> httpx.Response:
         """Send a POST request to the endpoint."""
         if self._client is None:
             raise KeyboardOutputError("Not connected to endpoint", backend="http")
         try:
-            resp = await self._client.post(path, json=payload)
+            resp = await self._client.post(
+                path, content=_dumps(payload), headers=_JSON_HEADERS
+            )
             resp.raise_for_status()
             return resp
         except httpx.HTTPError as e:
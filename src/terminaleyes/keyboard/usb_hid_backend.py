@@ -30,6 +30,8 @@ class UsbHidKeyboardOutput(KeyboardOutput):
         - /dev/hidg0 device present and writable
     """
 
+    __slots__ = ("_writer",)
+
     def __init__(
         self,
         device_path: str = "/dev/hidg0",
@@ -75,9 +77,14 @@ class UsbHidKeyboardOutput(KeyboardOutput):
             ) from e
 
     async def send_text(self, text: str) -> None:
-        """Type text character by character via USB HID reports."""
+        """Type text via pre-built USB HID report buffers.
+
+        Uses the writer's bulk path: the whole string is translated to
+        reports up front and written from one worker-thread call, instead
+        of two event-loop wakeups per character.
+        """
         try:
-            await self._writer.send_text(text)
+            await self._writer.send_text_bulk(text)
         except (ValueError, HidWriteError) as e:
             raise KeyboardOutputError(
                 f"Failed to send text: {e}", backend="usb_hid"
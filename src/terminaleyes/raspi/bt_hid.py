@@ -16,10 +16,13 @@ L2CAP channels:
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import socket
 import struct
+import sys
 from enum import IntFlag
+from typing import Awaitable, Callable
 
 from terminaleyes.raspi.hid_codes import (
     char_to_hid,
@@ -28,6 +31,7 @@ from terminaleyes.raspi.hid_codes import (
     MODIFIER_LEFT_SHIFT,
     MODIFIER_NONE,
     SHIFT_CHARS,
+    TYPEABLE_CHARS,
 )
 
 logger = logging.getLogger(__name__)
@@ -230,10 +234,14 @@ class MouseButton(IntFlag):
     MIDDLE = 0x04
 
 
-BUTTON_MAP: dict[str, MouseButton] = {
-    "left": MouseButton.LEFT,
-    "right": MouseButton.RIGHT,
-    "middle": MouseButton.MIDDLE,
+# Raw ints, not MouseButton members: IntFlag's __or__/__and__ go
+# through Python-level hooks and allocate a new instance per op, so
+# the hot path sticks to plain-int arithmetic. The enum stays public
+# for callers that want named constants.
+BUTTON_MAP: dict[str, int] = {
+    "left": 0x01,
+    "right": 0x02,
+    "middle": 0x04,
 }
 
 
@@ -245,14 +253,111 @@ def _clamp(value: int, minimum: int = -127, maximum: int = 127) -> int:
     return max(minimum, min(maximum, value))
 
 
+def _clamp_i8(v: int) -> int:
+    """Saturate to the signed-byte range the HID report's 'b' fields take.
+
+    Conditional expressions instead of max(min(...)): no builtin calls,
+    and in the common in-range case it is a single comparison pair.
+    """
+    return -127 if v < -127 else (127 if v > 127 else v)
+
+
+# The descriptor is a compile-time constant, so its hex form and the
+# formatted record are too — render both once at import. The hex string
+# is interned so other consumers share the same object.
+_REPORT_DESC_HEX = sys.intern(COMBO_REPORT_DESCRIPTOR.hex())
+_SDP_RECORD_CACHED = SDP_RECORD_XML.format(report_desc_hex=_REPORT_DESC_HEX)
+
+
 def build_sdp_record() -> str:
-    """Build the SDP record XML with the combo report descriptor."""
-    return SDP_RECORD_XML.format(report_desc_hex=COMBO_REPORT_DESCRIPTOR.hex())
+    """Return the SDP record XML with the combo report descriptor."""
+    return _SDP_RECORD_CACHED
 
 
+# Pre-compiled mouse report layout: header, report ID, buttons (unsigned),
+# then x/y/wheel as signed bytes. Skips format-string parsing per event.
+_MOUSE_REPORT_STRUCT = struct.Struct("BBBbbb")
+
 # 8-byte keyboard release report (all zeros)
 _KB_RELEASE = bytes(8)
 
+# Full 10-byte HIDP release report (header + report ID + all-zeros)
+_KB_RELEASE_REPORT = bytes([0xA1, REPORT_ID_KEYBOARD]) + _KB_RELEASE
+
+
+def _build_press_table() -> dict[str, bytes]:
+    """Map each typeable character to its complete 10-byte press report.
+
+    Built once at import so send_text does a single dict hit per
+    character instead of a char_to_hid lookup plus a fresh bytes([...])
+    construction for every press.
+    """
+    from terminaleyes.raspi.hid_codes import KEY_CODES
+
+    table: dict[str, bytes] = {}
+    for char, scan_code in KEY_CODES.items():
+        if len(char) == 1:
+            table[char] = bytes([
+                0xA1, REPORT_ID_KEYBOARD,
+                MODIFIER_NONE, 0x00, scan_code, 0x00, 0x00, 0x00, 0x00, 0x00,
+            ])
+    for shifted, base in SHIFT_CHARS.items():
+        table[shifted] = bytes([
+            0xA1, REPORT_ID_KEYBOARD,
+            MODIFIER_LEFT_SHIFT, 0x00, KEY_CODES[base],
+            0x00, 0x00, 0x00, 0x00, 0x00,
+        ])
+    return table
+
+
+_KB_PRESS_TABLE = _build_press_table()
+
+
+@functools.lru_cache(maxsize=32)
+def compile_text(text: str) -> Callable[[BluetoothHidServer], Awaitable[None]]:
+    """Specialize send_text for a fixed string via runtime codegen.
+
+    For macros replayed many times (demos, scripted automation), the
+    per-character dict lookups and loop overhead of send_text are pure
+    waste: every report byte is known up front. This emits a
+    straight-line coroutine of literal _send_raw calls and compiles it
+    once; replay is branch-free. The returned callable takes the
+    server instance::
+
+        play = compile_text("ls -la\\n"[:-1])
+        await play(server)
+
+    Note: deliberately skips send_text's wake-up pre-flight and
+    first-character warmup — macro callers replay into a session that
+    is already warm.
+
+    Raises:
+        ValueError: If any character has no HID mapping.
+    """
+    bad = set(text) - TYPEABLE_CHARS
+    if bad:
+        raise ValueError(f"No HID mapping for characters: {sorted(bad)!r}")
+    lines = [
+        "async def _play(server):",
+        "    send = server._send_raw",
+        "    sleep = asyncio.sleep",
+        "    kp = server._keypress_delay",
+        "    ic = server._inter_char_delay",
+    ]
+    if not text:
+        lines.append("    pass")
+    for char in text:
+        lines.append(f"    await send({_KB_PRESS_TABLE[char]!r})")
+        lines.append("    await sleep(kp)")
+        lines.append("    await send(_KB_RELEASE_REPORT)")
+        lines.append("    await sleep(ic)")
+    namespace: dict[str, object] = {
+        "asyncio": asyncio,
+        "_KB_RELEASE_REPORT": _KB_RELEASE_REPORT,
+    }
+    exec(compile("\n".join(lines), "<compile_text>", "exec"), namespace)
+    return namespace["_play"]  # type: ignore[return-value]
+
 
 class BluetoothHidServer:
     """Bluetooth HID combo device (keyboard + mouse) over L2CAP.
@@ -299,6 +404,11 @@ class BluetoothHidServer:
     _HANDSHAKE_NOT_READY = 0x01
     _HANDSHAKE_ERR_UNSUPPORTED = 0x05
 
+    # Pre-built one-byte control replies; handshakes come in bursts
+    # during connection setup and never need a fresh bytes object.
+    _HS_SUCCESS = bytes([_HANDSHAKE_SUCCESS])
+    _REPORT_PROTO = bytes([0x01])
+
     def __init__(
         self,
         keypress_delay: float = DEFAULT_KEYPRESS_DELAY,
@@ -312,7 +422,30 @@ class BluetoothHidServer:
         self._interrupt_client: socket.socket | None = None
         self._connected = False
         self._mouse_buttons: int = 0
-        self._control_task: asyncio.Task[None] | None = None
+        # Reusable report buffers: header bytes are written once and
+        # only the variable fields are mutated per send, so the hot
+        # path allocates nothing. The MSG_DONTWAIT fast path in
+        # _send_raw completes before control returns to the loop; when
+        # that path blocks, _send_raw snapshots the buffer to bytes
+        # first — uvicorn dispatches requests concurrently, so another
+        # handler may mutate these while a queued send is in flight.
+        self._kb_buf = bytearray(10)
+        self._kb_buf[0] = 0xA1
+        self._kb_buf[1] = REPORT_ID_KEYBOARD
+        self._kb_view = memoryview(self._kb_buf)
+        self._mouse_buf = bytearray(6)
+        self._mouse_view = memoryview(self._mouse_buf)
+        # Cached in wait_for_connection; saves a get_running_loop()
+        # thread-state lookup on every report send.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # HIDP message-type -> bound handler; O(1) dispatch in the
+        # control loop and trivially extensible.
+        self._ctrl_handlers = {
+            self._HIDP_SET_PROTOCOL: self._handle_set_protocol,
+            self._HIDP_GET_PROTOCOL: self._handle_get_protocol,
+            self._HIDP_SET_REPORT: self._handle_set_report,
+            self._HIDP_HID_CONTROL: self._handle_hid_control,
+        }
 
     @property
     def is_connected(self) -> bool:
@@ -333,10 +466,21 @@ class BluetoothHidServer:
             self._interrupt_sock.setsockopt(
                 socket.SOL_SOCKET, socket.SO_REUSEADDR, 1
             )
+            # Room for a full typing burst of 10-byte reports so
+            # back-to-back press/release pairs queue in the kernel
+            # instead of blocking between L2CAP PDUs.
+            self._interrupt_sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, 4096
+            )
             self._control_sock.bind(("00:00:00:00:00:00", PSM_CONTROL))
             self._interrupt_sock.bind(("00:00:00:00:00:00", PSM_INTERRUPT))
             self._control_sock.listen(1)
             self._interrupt_sock.listen(1)
+            # Non-blocking listeners so wait_for_connection can use
+            # loop.sock_accept instead of parking executor threads —
+            # the selector handles AF_BLUETOOTH fds like any other.
+            self._control_sock.setblocking(False)
+            self._interrupt_sock.setblocking(False)
             logger.info(
                 "Bluetooth HID server listening (PSM %d control, PSM %d interrupt)",
                 PSM_CONTROL, PSM_INTERRUPT,
@@ -344,59 +488,87 @@ class BluetoothHidServer:
         except OSError as e:
             raise BtHidError(f"Failed to create L2CAP sockets: {e}") from e
 
-    async def _control_channel_loop(self) -> None:
-        """Read and respond to HIDP messages on the control channel.
+    def _on_control_readable(self) -> None:
+        """Handle one readable event on the control channel.
 
-        Runs as a background task while a client is connected.  Handles
-        SET_PROTOCOL (0x70/0x71) and GET_PROTOCOL (0x60) which macOS
-        sends during HID connection setup.
+        Registered with loop.add_reader, so inbound HIDP messages are
+        handled as plain callbacks — no coroutine frame or Task
+        scheduling per packet. Handles SET_PROTOCOL (0x70/0x71) and
+        GET_PROTOCOL (0x60) which macOS sends during HID connection
+        setup. Handshake replies are single bytes, which never block
+        on a non-blocking socket, so they are sent inline.
         """
         sock = self._control_client
         if sock is None:
             return
-        loop = asyncio.get_running_loop()
-        sock.setblocking(False)
         try:
-            while self._connected:
-                try:
-                    data = await loop.sock_recv(sock, 1024)
-                except (BlockingIOError, OSError):
-                    break
-                if not data:
-                    logger.info("Control channel closed by peer")
-                    break
-                msg_type = data[0] & 0xF0
-                param = data[0] & 0x0F
-                logger.info(
-                    "Control channel msg: 0x%02X (type=0x%02X param=0x%02X) %s",
-                    data[0], msg_type, param, data.hex(),
-                )
-                if msg_type == self._HIDP_SET_PROTOCOL:
-                    # param: 0=Boot Protocol, 1=Report Protocol
-                    logger.info(
-                        "SET_PROTOCOL: %s mode",
-                        "Report" if param == 1 else "Boot",
-                    )
-                    await loop.sock_sendall(
-                        sock, bytes([self._HANDSHAKE_SUCCESS])
-                    )
-                elif msg_type == self._HIDP_GET_PROTOCOL:
-                    # Respond with Report Protocol (0x01)
-                    await loop.sock_sendall(sock, bytes([0x01]))
-                elif msg_type == self._HIDP_SET_REPORT:
-                    # ACK output reports (e.g. LED state)
-                    await loop.sock_sendall(
-                        sock, bytes([self._HANDSHAKE_SUCCESS])
-                    )
-                elif msg_type == self._HIDP_HID_CONTROL:
-                    if param == 0x03:  # EXIT_SUSPEND
-                        logger.info("HID_CONTROL: exit suspend")
-                    else:
-                        logger.info("HID_CONTROL: param=0x%02X", param)
-                else:
-                    logger.info("Unhandled control msg type 0x%02X", msg_type)
-        except Exception as e:
-            logger.debug("Control channel loop ended: %s", e)
+            data = sock.recv(1024)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            logger.debug("Control channel read failed: %s", e)
+            self._remove_control_reader()
+            return
+        if not data:
+            logger.info("Control channel closed by peer")
+            self._remove_control_reader()
+            return
+        msg_type = data[0] & 0xF0
+        param = data[0] & 0x0F
+        # data.hex() is built eagerly as a call argument, so gate the
+        # whole record — routine control traffic is DEBUG, not INFO.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Control channel msg: 0x%02X (type=0x%02X param=0x%02X) %s",
+                data[0], msg_type, param, data.hex(),
+            )
+        handler = self._ctrl_handlers.get(msg_type)
+        if handler is not None:
+            handler(sock, param, data)
+        else:
+            logger.info("Unhandled control msg type 0x%02X", msg_type)
+
+    def _remove_control_reader(self) -> None:
+        """Unregister the control-channel read callback, if armed."""
+        if self._loop is not None and self._control_client is not None:
+            try:
+                self._loop.remove_reader(self._control_client.fileno())
+            except (OSError, ValueError):
+                pass
+
+    def _send_control(self, sock: socket.socket, response: bytes) -> None:
+        """Send a one-byte handshake reply on the control channel."""
+        try:
+            sock.send(response)
+        except OSError as e:
+            logger.debug("Control channel reply failed: %s", e)
+
+    def _handle_set_protocol(
+        self, sock: socket.socket, param: int, data: bytes
+    ) -> None:
+        # param: 0=Boot Protocol, 1=Report Protocol
+        logger.debug("SET_PROTOCOL: %s mode", "Report" if param == 1 else "Boot")
+        self._send_control(sock, self._HS_SUCCESS)
+
+    def _handle_get_protocol(
+        self, sock: socket.socket, param: int, data: bytes
+    ) -> None:
+        # Respond with Report Protocol (0x01)
+        self._send_control(sock, self._REPORT_PROTO)
+
+    def _handle_set_report(
+        self, sock: socket.socket, param: int, data: bytes
+    ) -> None:
+        # ACK output reports (e.g. LED state)
+        self._send_control(sock, self._HS_SUCCESS)
+
+    def _handle_hid_control(
+        self, sock: socket.socket, param: int, data: bytes
+    ) -> None:
+        if param == 0x03:  # EXIT_SUSPEND
+            logger.debug("HID_CONTROL: exit suspend")
+        else:
+            logger.debug("HID_CONTROL: param=0x%02X", param)
 
     async def wait_for_connection(self) -> str:
         """Wait for a Bluetooth host to connect. Returns host address."""
@@ -404,32 +576,66 @@ class BluetoothHidServer:
             raise BtHidError("Server not started")
 
         loop = asyncio.get_running_loop()
+        self._loop = loop
         logger.info("Waiting for Bluetooth HID connection...")
 
-        self._control_client, ctrl_addr = await loop.run_in_executor(
-            None, self._control_sock.accept
-        )
+        self._control_client, ctrl_addr = await loop.sock_accept(self._control_sock)
         logger.info("Control channel connected from %s", ctrl_addr[0])
 
-        self._interrupt_client, intr_addr = await loop.run_in_executor(
-            None, self._interrupt_sock.accept
+        self._interrupt_client, intr_addr = await loop.sock_accept(
+            self._interrupt_sock
         )
         logger.info("Interrupt channel connected from %s", intr_addr[0])
 
+        # Non-blocking so _send_raw can use the event loop's own socket
+        # send path instead of bouncing every report off a worker thread.
+        self._interrupt_client.setblocking(False)
+        try:
+            self._interrupt_client.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, 4096
+            )
+        except OSError:
+            # Accepted L2CAP sockets on some kernels refuse resizing;
+            # the listener's buffer size usually carries over anyway.
+            pass
+
         self._connected = True
 
-        # Start reading control channel messages in the background
-        self._control_task = asyncio.create_task(self._control_channel_loop())
+        # Read control channel messages via a selector callback — no
+        # background task to schedule per packet.
+        self._control_client.setblocking(False)
+        loop.add_reader(self._control_client.fileno(), self._on_control_readable)
 
         return ctrl_addr[0]
 
-    async def _send_raw(self, data: bytes) -> None:
-        """Send raw bytes on the interrupt channel."""
+    async def _send_raw(self, data: bytes | bytearray | memoryview) -> None:
+        """Send raw bytes on the interrupt channel.
+
+        The interrupt socket is non-blocking, so the 4-10 byte reports
+        go straight through the event loop's sock_sendall — no
+        thread-pool hop per keystroke or mouse move.
+        """
         if not self._interrupt_client:
             raise BtHidError("No Bluetooth client connected")
-        loop = asyncio.get_running_loop()
         try:
-            await loop.run_in_executor(None, self._interrupt_client.send, data)
+            # Fast path: a 4-10 byte report on a healthy interrupt
+            # channel never blocks, so skip the selector round trip.
+            self._interrupt_client.send(data, socket.MSG_DONTWAIT)
+            return
+        except BlockingIOError:
+            pass
+        except OSError as e:
+            self._connected = False
+            raise BtHidError(f"Failed to send HID report: {e}") from e
+        loop = self._loop or asyncio.get_running_loop()
+        # sock_sendall suspends, and another concurrently dispatched
+        # request may mutate the reusable report buffers while this one
+        # is queued — snapshot mutable data to immutable bytes so the
+        # queued report can't be corrupted mid-send.
+        if not isinstance(data, bytes):
+            data = bytes(data)
+        try:
+            await loop.sock_sendall(self._interrupt_client, data)
         except OSError as e:
             self._connected = False
             raise BtHidError(f"Failed to send HID report: {e}") from e
@@ -440,18 +646,16 @@ class BluetoothHidServer:
 
     async def _send_keyboard_report(self, modifier: int, scan_code: int) -> None:
         """Send a keyboard HID report (report ID 1)."""
-        # 0xA1 = HIDP DATA|INPUT, then report ID, then 8 bytes keyboard
-        report = bytes([
-            0xA1,
-            REPORT_ID_KEYBOARD,
-            modifier, 0x00, scan_code, 0x00, 0x00, 0x00, 0x00, 0x00,
-        ])
-        await self._send_raw(report)
+        # 0xA1 = HIDP DATA|INPUT header and report ID are pre-written in
+        # the reusable buffer; bytes 3 and 5-9 stay zero forever.
+        buf = self._kb_buf
+        buf[2] = modifier
+        buf[4] = scan_code
+        await self._send_raw(self._kb_view)
 
     async def _release_keyboard(self) -> None:
         """Send an all-zeros keyboard report (release all keys)."""
-        report = bytes([0xA1, REPORT_ID_KEYBOARD]) + _KB_RELEASE
-        await self._send_raw(report)
+        await self._send_raw(_KB_RELEASE_REPORT)
 
     async def _tap_key(self, modifier: int, scan_code: int) -> None:
         """Press and release a key with timing."""
@@ -459,6 +663,12 @@ class BluetoothHidServer:
         await asyncio.sleep(self._keypress_delay)
         await self._release_keyboard()
 
+    async def _tap_report(self, press_report: bytes) -> None:
+        """Press and release from a pre-built press report."""
+        await self._send_raw(press_report)
+        await asyncio.sleep(self._keypress_delay)
+        await self._send_raw(_KB_RELEASE_REPORT)
+
     async def _keystroke_preflight(self) -> None:
         """Clear lingering keyboard state and let the receiver's
         input subsystem drain before sending a new key.
@@ -537,6 +747,11 @@ class BluetoothHidServer:
         """
         if not text:
             return
+        # Validate the whole string up front (one C-level subset test)
+        # so an unmappable character can't leave the host half-typed.
+        bad = set(text) - TYPEABLE_CHARS
+        if bad:
+            raise ValueError(f"No HID mapping for characters: {sorted(bad)!r}")
         # Pre-flight: three releases + 500ms settle. Drains any
         # half-processed report state on the receiver side.
         for _ in range(3):
@@ -578,9 +793,9 @@ class BluetoothHidServer:
         else:
             chars_iter = text
 
+        table = _KB_PRESS_TABLE
         for char in chars_iter:
-            modifier, scan_code = char_to_hid(char)
-            await self._tap_key(modifier, scan_code)
+            await self._tap_report(table[char])
             await asyncio.sleep(self._inter_char_delay)
         logger.debug("BT text: %s", text[:50])
 
@@ -592,13 +807,15 @@ class BluetoothHidServer:
         self, buttons: int, x: int, y: int, wheel: int
     ) -> None:
         """Send a mouse HID report (report ID 2)."""
-        x = _clamp(x)
-        y = _clamp(y)
-        wheel = _clamp(wheel)
+        x = -127 if x < -127 else 127 if x > 127 else x
+        y = -127 if y < -127 else 127 if y > 127 else y
+        wheel = -127 if wheel < -127 else 127 if wheel > 127 else wheel
         # 0xA1 header + report ID 2 + 4 bytes mouse data
         # buttons is unsigned byte, x/y are signed, wheel is signed
-        report = struct.pack("BBBbbb", 0xA1, REPORT_ID_MOUSE, buttons, x, y, wheel)
-        await self._send_raw(report)
+        _MOUSE_REPORT_STRUCT.pack_into(
+            self._mouse_buf, 0, 0xA1, REPORT_ID_MOUSE, buttons, x, y, wheel
+        )
+        await self._send_raw(self._mouse_view)
 
     async def move(self, x: int, y: int) -> None:
         """Move the mouse cursor by (x, y) relative pixels."""
@@ -613,7 +830,7 @@ class BluetoothHidServer:
         self._mouse_buttons |= btn
         await self._send_mouse_report(self._mouse_buttons, 0, 0, 0)
         await asyncio.sleep(0.05)
-        self._mouse_buttons &= ~btn
+        self._mouse_buttons &= ~btn & 0xFF
         await self._send_mouse_report(self._mouse_buttons, 0, 0, 0)
         logger.debug("BT mouse click: %s", button)
 
@@ -638,7 +855,7 @@ class BluetoothHidServer:
         btn = BUTTON_MAP.get(button.lower())
         if btn is None:
             raise ValueError(f"Unknown button: {button!r}. Use: left, right, middle")
-        self._mouse_buttons &= ~btn
+        self._mouse_buttons &= ~btn & 0xFF
         await self._send_mouse_report(self._mouse_buttons, 0, 0, 0)
         logger.debug("BT mouse release: %s", button)
 
@@ -654,9 +871,7 @@ class BluetoothHidServer:
     async def stop(self) -> None:
         """Close all sockets and cancel background tasks."""
         self._connected = False
-        if self._control_task is not None:
-            self._control_task.cancel()
-            self._control_task = None
+        self._remove_control_reader()
         for sock in (
             self._interrupt_client,
             self._control_client,
@@ -672,6 +887,7 @@ class BluetoothHidServer:
         self._control_client = None
         self._interrupt_sock = None
         self._control_sock = None
+        self._loop = None
         logger.info("Bluetooth HID server stopped")
 
 
@@ -679,13 +895,122 @@ class BluetoothHidServer:
 # BlueZ / D-Bus helpers
 # ------------------------------------------------------------------
 
-def register_sdp_profile() -> None:
-    """Register the HID combo SDP profile with BlueZ via D-Bus."""
+_HID_PROFILE_PATH = "/org/bluez/terminaleyes_hid"
+_HID_PROFILE_UUID = "00001124-0000-1000-8000-00805f9b34fb"
+
+_ADAPTER_PROPS = [
+    ("Powered", True),
+    ("Discoverable", True),
+    ("DiscoverableTimeout", 0),
+    ("Pairable", True),
+]
+
+
+async def register_sdp_profile() -> None:
+    """Register the HID combo SDP profile with BlueZ via D-Bus.
+
+    Prefers dbus-fast (async, C-accelerated marshalling) so startup
+    never blocks the event loop; falls back to the synchronous
+    python3-dbus bindings in a worker thread when it isn't installed.
+    """
+    try:
+        import dbus_fast  # noqa: F401
+    except ImportError:
+        await asyncio.to_thread(_register_sdp_profile_dbus)
+        return
+    await _register_sdp_profile_dbus_fast()
+
+
+async def configure_bluetooth_adapter() -> None:
+    """Make the Bluetooth adapter discoverable and set combo device class.
+
+    Safe to call multiple times — silently ignores properties that are
+    already set or that BlueZ refuses to change. Same dbus-fast /
+    python3-dbus preference as register_sdp_profile.
+    """
+    try:
+        import dbus_fast  # noqa: F401
+    except ImportError:
+        await asyncio.to_thread(_configure_bluetooth_adapter_dbus)
+        return
+    await _configure_bluetooth_adapter_dbus_fast()
+
+
+async def _get_dbus_fast_iface(path: str, interface: str):
+    """Connect to the system bus and fetch one proxy interface."""
+    from dbus_fast import BusType
+    from dbus_fast.aio import MessageBus
+
+    bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+    introspection = await bus.introspect("org.bluez", path)
+    proxy = bus.get_proxy_object("org.bluez", path, introspection)
+    return bus, proxy.get_interface(interface)
+
+
+async def _register_sdp_profile_dbus_fast() -> None:
+    from dbus_fast import DBusError, Variant
+
+    bus, manager = await _get_dbus_fast_iface(
+        "/org/bluez", "org.bluez.ProfileManager1"
+    )
+    opts = {
+        "Role": Variant("s", "server"),
+        "RequireAuthentication": Variant("b", False),
+        "RequireAuthorization": Variant("b", False),
+        "AutoConnect": Variant("b", True),
+        "ServiceRecord": Variant("s", build_sdp_record()),
+    }
+    try:
+        await manager.call_register_profile(
+            _HID_PROFILE_PATH, _HID_PROFILE_UUID, opts
+        )
+        logger.info("Bluetooth HID combo profile registered with BlueZ")
+    except DBusError as e:
+        err_str = str(e)
+        if "AlreadyExists" in err_str or "already registered" in err_str.lower():
+            logger.info("Bluetooth HID profile already registered")
+        elif "NotPermitted" in err_str:
+            logger.info(
+                "Bluetooth HID profile registration not permitted (may already be active)"
+            )
+        else:
+            raise BtHidError(f"Failed to register BT profile: {e}") from e
+    finally:
+        bus.disconnect()
+
+
+async def _configure_bluetooth_adapter_dbus_fast() -> None:
+    from dbus_fast import DBusError, Variant
+
+    bus, props = await _get_dbus_fast_iface(
+        "/org/bluez/hci0", "org.freedesktop.DBus.Properties"
+    )
+    signatures = {"DiscoverableTimeout": "u"}
+    try:
+        for prop, val in _ADAPTER_PROPS:
+            try:
+                await props.call_set(
+                    "org.bluez.Adapter1",
+                    prop,
+                    Variant(signatures.get(prop, "b"), val),
+                )
+            except DBusError as e:
+                logger.debug(
+                    "Could not set adapter %s: %s (may already be set)", prop, e
+                )
+        logger.info("Bluetooth adapter configured: discoverable + pairable")
+    finally:
+        bus.disconnect()
+
+
+def _register_sdp_profile_dbus() -> None:
+    """Synchronous python3-dbus fallback for register_sdp_profile."""
     try:
         import dbus  # type: ignore[import-untyped]
     except ImportError as e:
         raise BtHidError(
-            "python3-dbus not installed. Run: sudo apt install python3-dbus"
+            "Neither dbus-fast nor python3-dbus installed. "
+            "Run: pip install dbus-fast (or sudo apt install python3-dbus)"
         ) from e
 
     bus = dbus.SystemBus()
@@ -719,17 +1044,14 @@ def register_sdp_profile() -> None:
             raise BtHidError(f"Failed to register BT profile: {e}") from e
 
 
-def configure_bluetooth_adapter() -> None:
-    """Make the Bluetooth adapter discoverable and set combo device class.
-
-    Safe to call multiple times — silently ignores properties that are
-    already set or that BlueZ refuses to change.
-    """
+def _configure_bluetooth_adapter_dbus() -> None:
+    """Synchronous python3-dbus fallback for configure_bluetooth_adapter."""
     try:
         import dbus  # type: ignore[import-untyped]
     except ImportError as e:
         raise BtHidError(
-            "python3-dbus not installed. Run: sudo apt install python3-dbus"
+            "Neither dbus-fast nor python3-dbus installed. "
+            "Run: pip install dbus-fast (or sudo apt install python3-dbus)"
         ) from e
 
     bus = dbus.SystemBus()
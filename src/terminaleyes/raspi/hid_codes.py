@@ -12,6 +12,8 @@ A USB HID keyboard report is 8 bytes:
 
 from __future__ import annotations
 
+import functools
+
 # ---------------------------------------------------------------------------
 # Modifier bitmasks (byte 0 of HID report)
 # ---------------------------------------------------------------------------
@@ -44,6 +46,11 @@ MODIFIER_MAP: dict[str, int] = {
     "right_meta": MODIFIER_RIGHT_META,
 }
 
+# Common case variants pre-registered so the hot path can look names
+# up verbatim; a .lower() retry only happens on a genuine miss.
+MODIFIER_MAP.update({k.upper(): v for k, v in MODIFIER_MAP.items()})
+MODIFIER_MAP.update({k.capitalize(): v for k, v in list(MODIFIER_MAP.items())})
+
 # ---------------------------------------------------------------------------
 # Key name -> USB HID scan code
 # ---------------------------------------------------------------------------
@@ -112,6 +119,60 @@ SHIFT_CHARS: dict[str, str] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Fused lookup tables (built once at import)
+# ---------------------------------------------------------------------------
+
+# Character -> (modifier, scan_code) in one dict hit. Folds the
+# KEY_CODES-then-SHIFT_CHARS-then-KEY_CODES dance into a single lookup
+# for the per-character hot path of send_text.
+_CHAR_TO_MOD_SC: dict[str, tuple[int, int]] = {
+    c: (MODIFIER_NONE, sc) for c, sc in KEY_CODES.items() if len(c) == 1
+}
+for _shifted, _base in SHIFT_CHARS.items():
+    _CHAR_TO_MOD_SC[_shifted] = (MODIFIER_LEFT_SHIFT, KEY_CODES[_base])
+
+# Structure-of-arrays form of the character table: two 128-entry bytes
+# strings indexed by ord(char), 0xFF marking unsupported scan slots.
+# Indexing immutable bytes skips hashing entirely, which matters at
+# send_text character rates; every typeable char is ASCII so coverage
+# is complete. (Two bytes tables rather than one packed (mod<<8)|code
+# array: bytes indexing yields small ints with no unpacking arithmetic
+# per character.)
+_ascii_sc = bytearray(b"\xff" * 128)
+_ascii_mod = bytearray(128)
+for _c, (_mod, _sc) in _CHAR_TO_MOD_SC.items():
+    _ascii_sc[ord(_c)] = _sc
+    _ascii_mod[ord(_c)] = _mod
+_ASCII_TO_SC: bytes = bytes(_ascii_sc)
+_ASCII_TO_MOD: bytes = bytes(_ascii_mod)
+del _ascii_sc, _ascii_mod
+
+# Every character that can be typed as a single HID report. Callers
+# can subset-test an entire string against this in one C-level set op
+# before sending anything, instead of failing mid-stream.
+TYPEABLE_CHARS: frozenset[str] = frozenset(_CHAR_TO_MOD_SC)
+
+# Key name -> scan code with the single-char case-fold pre-applied, so
+# key_name_to_hid never allocates a lowered copy on a hit. "" -> 0
+# keeps the modifier-only tap contract.
+_KEY_NAME_TO_SC: dict[str, int] = dict(KEY_CODES)
+_KEY_NAME_TO_SC[""] = 0
+for _c in "abcdefghijklmnopqrstuvwxyz":
+    _KEY_NAME_TO_SC.setdefault(_c.upper(), KEY_CODES[_c])
+
+# ASCII plane of the name table: scan codes for single-character key
+# names, indexed by ord. 0 marks "no mapping" (no single-char name
+# maps to scan code 0). Lets key_name_to_hid resolve the dominant
+# single-letter case with a bytes index instead of a string hash.
+_ascii_name = bytearray(128)
+for _name, _sc in _KEY_NAME_TO_SC.items():
+    if len(_name) == 1 and ord(_name) < 128:
+        _ascii_name[ord(_name)] = _sc
+_ASCII_NAME_SC: bytes = bytes(_ascii_name)
+del _ascii_name
+
+
 def char_to_hid(char: str) -> tuple[int, int]:
     """Convert a single character to (modifier_byte, scan_code).
 
@@ -121,12 +182,12 @@ def char_to_hid(char: str) -> tuple[int, int]:
     Raises:
         ValueError: If the character has no known HID mapping.
     """
-    if char in KEY_CODES:
-        return (MODIFIER_NONE, KEY_CODES[char])
-    if char in SHIFT_CHARS:
-        base_char = SHIFT_CHARS[char]
-        if base_char in KEY_CODES:
-            return (MODIFIER_LEFT_SHIFT, KEY_CODES[base_char])
+    if len(char) == 1:
+        o = ord(char)
+        if o < 128:
+            sc = _ASCII_TO_SC[o]
+            if sc != 0xFF:
+                return (_ASCII_TO_MOD[o], sc)
     raise ValueError(f"No HID mapping for character: {char!r}")
 
 
@@ -140,26 +201,48 @@ def key_name_to_hid(key: str) -> int:
     Raises:
         ValueError: If the key name is not recognized.
     """
-    if key == "":
-        return 0
-    if key in KEY_CODES:
-        return KEY_CODES[key]
-    # Try case-insensitive lookup for single chars
-    if len(key) == 1 and key.lower() in KEY_CODES:
-        return KEY_CODES[key.lower()]
-    raise ValueError(f"Unknown key name: {key!r}")
+    if len(key) == 1:
+        o = ord(key)
+        if o < 128:
+            sc = _ASCII_NAME_SC[o]
+            if sc:
+                return sc
+            raise ValueError(f"Unknown key name: {key!r}")
+    try:
+        return _KEY_NAME_TO_SC[key]
+    except KeyError:
+        raise ValueError(f"Unknown key name: {key!r}") from None
+
+
+@functools.lru_cache(maxsize=64)
+def _bitmask_for(modifiers: tuple[str, ...]) -> int:
+    """Compute the combined bitmask for a modifier tuple.
+
+    Cached: combos repeat the same handful of modifier lists (e.g.
+    ("ctrl",), ("ctrl", "shift")), so after the first occurrence the
+    whole loop — including the .lower() allocations — collapses to
+    one cache hit.
+    """
+    bitmask = MODIFIER_NONE
+    for mod in modifiers:
+        bits = MODIFIER_MAP.get(mod)
+        if bits is None:
+            # Mixed-case spelling not in the pre-registered aliases
+            # (e.g. "CTRL" is, "cTrL" isn't) — lower once and retry.
+            bits = MODIFIER_MAP.get(mod.lower())
+            if bits is None:
+                raise ValueError(f"Unknown modifier: {mod!r}")
+        bitmask |= bits
+    return bitmask
 
 
 def modifiers_to_bitmask(modifiers: list[str]) -> int:
     """Convert a list of modifier names to a combined bitmask.
 
+    Delegates to the lru_cached ``_bitmask_for`` — the handful of
+    combos a session uses resolve to one tuple hash after first sight.
+
     Raises:
         ValueError: If any modifier name is not recognized.
     """
-    bitmask = MODIFIER_NONE
-    for mod in modifiers:
-        mod_lower = mod.lower()
-        if mod_lower not in MODIFIER_MAP:
-            raise ValueError(f"Unknown modifier: {mod!r}")
-        bitmask |= MODIFIER_MAP[mod_lower]
-    return bitmask
+    return _bitmask_for(tuple(modifiers))
@@ -8,6 +8,25 @@ Mouse (/dev/hidg1): 4-byte reports
 
 A key press is sent by writing a report with the key, then a release
 is sent by writing an all-zeros report.
+
+On I/O strategy: the writers deliberately use plain os.write/os.writev
+rather than an io_uring ring (with or without SQPOLL). f_hid gadget
+writes complete synchronously in the kernel driver, report payloads
+are 8 bytes, and the per-op costs that a ring amortizes are already
+removed here by inline writes and writev batching — while SQPOLL would
+pin a kernel polling thread on the Pi Zero's four small cores and pull
+in a native liburing dependency for no measurable win at keystroke
+rates. The same applies to io_uring fixed-file registration: it saves
+one fdget/fdput per submission, which is noise next to the gadget
+driver's own report handling, and the fd here is opened once and held
+for the process lifetime anyway.
+
+A fully synchronous writer behind a single-worker executor was also
+considered and rejected: gadget writes complete synchronously in the
+driver, so per-keystroke ops are cheaper inline on the loop than an
+executor round trip, while the one case where a worker thread does win
+— long unpaced strings — already goes through send_text_sync via
+send_text_bulk.
 """
 
 from __future__ import annotations
@@ -19,6 +38,7 @@ from enum import IntFlag
 from pathlib import Path
 
 from terminaleyes.raspi.hid_codes import (
+    KEY_CODES,
     MODIFIER_LEFT_SHIFT,
     MODIFIER_NONE,
     SHIFT_CHARS,
@@ -32,6 +52,56 @@ logger = logging.getLogger(__name__)
 # 8-byte empty report = all keys released
 RELEASE_REPORT = b"\x00" * 8
 
+# Lazily-filled (modifier, scan_code) -> immutable 8-byte press report.
+# The practical key/modifier combinations number a few hundred at most,
+# so the cache is tiny and press_key allocates nothing after first use.
+# Cached immutable bytes beat a single reused bytearray here: a mutable
+# buffer would still need a bytes() copy (or careful aliasing) per
+# write, while these are handed to os.write as-is, repeatedly. The
+# same goes for a struct.pack_into scratch buffer — pack_into plus the
+# copy is strictly more work than this dict probe.
+_PRESS_REPORTS: dict[tuple[int, int], bytes] = {}
+
+
+def _build_ascii_table() -> list[tuple[int, int, bytes] | None]:
+    """Build a 256-entry ord(char) -> (modifier, scan_code, press_report).
+
+    Typing is dominated by per-char lookups; an indexed load into this
+    table replaces two dict probes per character. None marks characters
+    with no HID mapping (the slow path raises for those). Only the
+    press report is stored — every release is the shared
+    RELEASE_REPORT constant, so a per-char (press, release) pair would
+    just duplicate it 95 times.
+    """
+    table: list[tuple[int, int, bytes] | None] = [None] * 256
+    for char, code in KEY_CODES.items():
+        if len(char) == 1:
+            report = bytes([MODIFIER_NONE, 0x00, code, 0x00, 0x00, 0x00, 0x00, 0x00])
+            table[ord(char)] = (MODIFIER_NONE, code, report)
+    for char, base_char in SHIFT_CHARS.items():
+        code = KEY_CODES.get(base_char)
+        if code is not None:
+            report = bytes([MODIFIER_LEFT_SHIFT, 0x00, code, 0x00, 0x00, 0x00, 0x00, 0x00])
+            table[ord(char)] = (MODIFIER_LEFT_SHIFT, code, report)
+    return table
+
+
+_ASCII_REPORTS: list[tuple[int, int, bytes] | None] = _build_ascii_table()
+
+# Key name -> (modifier, scan_code), covering named keys, plain chars
+# and shifted chars in one dict. send_keystroke resolves any key in a
+# single probe instead of branching through SHIFT_CHARS / char_to_hid /
+# key_name_to_hid per call. A precomputed table also beats memoizing
+# the resolver with lru_cache: no wrapper call, and no cold-miss path
+# for keys the table already covers.
+_KEYSTROKE_TABLE: dict[str, tuple[int, int]] = {
+    name: (MODIFIER_NONE, code) for name, code in KEY_CODES.items()
+}
+_KEYSTROKE_TABLE.update(
+    (char, (MODIFIER_LEFT_SHIFT, KEY_CODES[base]))
+    for char, base in SHIFT_CHARS.items()
+)
+
 # Default delay between key press and release (seconds)
 DEFAULT_KEYPRESS_DELAY = 0.02
 # Default delay between consecutive characters when typing text
@@ -42,6 +112,64 @@ class HidWriteError(Exception):
     """Raised when writing to the HID device fails."""
 
 
+def _write_all_blocking(fd: int, data: bytes | memoryview) -> None:
+    """Write ``data`` fully to a nonblocking fd, from a worker thread.
+
+    The gadget fds are opened O_NONBLOCK so the event-loop writers can
+    detect a full FIFO, which means a plain os.write here can return a
+    short count or raise EAGAIN under backpressure. This helper waits
+    for writability between attempts — blocking is fine off the loop —
+    and only returns once every byte has been accepted.
+    """
+    import os
+    import select
+
+    view = memoryview(data)
+    off = 0
+    while off < len(view):
+        try:
+            off += os.write(fd, view[off:])
+        except BlockingIOError:
+            select.select([], [fd], [])
+
+
+def _writev_reports_blocking(
+    fd: int, buf: bytes | bytearray | memoryview, start: int = 0
+) -> None:
+    """Write a flat buffer of 8-byte reports via writev, from a worker thread.
+
+    The f_hid gadget holds a single in-flight input report, so a burst
+    of back-to-back iovecs routinely comes back with a short byte count
+    once the pending report fills — the kernel's per-segment loop stops
+    at the first EAGAIN. Resubmits the unsent tail (waiting for
+    writability when nothing was accepted) until the whole buffer is on
+    the wire; the host's interrupt polling drains one report per poll.
+    ``start`` may fall mid-report (e.g. after a caller's own short
+    writev) — the partial report is completed before re-slicing on
+    report boundaries.
+    """
+    import os
+    import select
+
+    view = memoryview(buf)
+    total = len(view)
+    off = start
+    while off < total:
+        partial = off % 8
+        if partial:
+            # f_hid consumes iovecs a whole report at a time, but don't
+            # bet on it: finish a part-accepted report first.
+            _write_all_blocking(fd, view[off : off + 8 - partial])
+            off += 8 - partial
+            continue
+        # IOV_MAX caps a single writev at 1024 segments (512 chars).
+        end = min(off + 8 * 1024, total)
+        try:
+            off += os.writev(fd, [view[o : o + 8] for o in range(off, end, 8)])
+        except BlockingIOError:
+            select.select([], [fd], [])
+
+
 class HidWriter:
     """Writes USB HID keyboard reports to /dev/hidg0.
 
@@ -74,10 +202,12 @@ class HidWriter:
         import os
 
         try:
-            # Open in non-blocking write mode; run in executor since it's I/O
-            loop = asyncio.get_running_loop()
-            self._fd = await loop.run_in_executor(
-                None, lambda: os.open(str(self._device_path), os.O_WRONLY)
+            # Opening the gadget cdev never blocks on hardware, so the
+            # executor hop is pure overhead — open inline. O_NONBLOCK
+            # lets _write_report detect a full FIFO instead of stalling
+            # the loop; O_CLOEXEC keeps the fd out of child processes.
+            self._fd = os.open(
+                str(self._device_path), os.O_WRONLY | os.O_NONBLOCK | os.O_CLOEXEC
             )
             logger.info("Opened HID device: %s", self._device_path)
         except OSError as e:
@@ -95,32 +225,67 @@ class HidWriter:
             except HidWriteError:
                 pass
             try:
-                loop = asyncio.get_running_loop()
-                fd = self._fd
-                await loop.run_in_executor(None, lambda: os.close(fd))
+                os.close(self._fd)
             except OSError:
                 pass
             self._fd = None
             logger.info("Closed HID device")
 
-    async def _write_report(self, report: bytes) -> None:
-        """Write an 8-byte HID report to the device."""
-        import os
-
+    async def _write_report(self, report: bytes | bytearray) -> None:
+        """Write an 8-byte HID report to the device (validated)."""
         if self._fd is None:
             raise HidWriteError("HID device not open")
         if len(report) != 8:
             raise HidWriteError(f"HID report must be 8 bytes, got {len(report)}")
+        await self._write_report_raw(report)
+
+    async def _write_report_raw(self, report: bytes | bytearray) -> None:
+        """Write a report without the open/length checks.
+
+        For internal hot loops that have already validated the device
+        and only send table-built 8-byte reports — skips two branches
+        per report, which send_text pays 2x len(text) times.
+        """
+        import os
+
+        written = 0
         try:
+            # The gadget driver queues the report synchronously, so the
+            # 8-byte write is cheaper than an executor round trip — do
+            # it inline on the loop thread. The pacing sleeps between
+            # reports already yield to the loop, so no explicit
+            # sleep(0) is needed either.
+            written = os.write(self._fd, report)
+            if written < len(report):
+                # The gadget FIFO can accept a short count under
+                # backpressure; push the remainder of this report
+                # rather than surfacing a partial write to callers,
+                # who would have to rebuild and resend the report.
+                mv = memoryview(bytes(report))
+                while written < len(mv):
+                    written += os.write(self._fd, mv[written:])
+        except BlockingIOError:
+            # Gadget FIFO momentarily full. The fd stays O_NONBLOCK, so
+            # a bare executor os.write would just raise EAGAIN again —
+            # finish the unsent tail in a worker thread that waits for
+            # writability between attempts.
             loop = asyncio.get_running_loop()
             fd = self._fd
-            await loop.run_in_executor(None, lambda: os.write(fd, report))
+            pending = bytes(report)[written:]
+            try:
+                await loop.run_in_executor(None, _write_all_blocking, fd, pending)
+            except OSError as e:
+                raise HidWriteError(f"Failed to write HID report: {e}") from e
         except OSError as e:
             raise HidWriteError(f"Failed to write HID report: {e}") from e
 
     async def press_key(self, modifier: int, scan_code: int) -> None:
         """Send a key-press report (modifier + one key)."""
-        report = bytes([modifier, 0x00, scan_code, 0x00, 0x00, 0x00, 0x00, 0x00])
+        key = (modifier, scan_code)
+        report = _PRESS_REPORTS.get(key)
+        if report is None:
+            report = bytes([modifier, 0x00, scan_code, 0x00, 0x00, 0x00, 0x00, 0x00])
+            _PRESS_REPORTS[key] = report
         await self._write_report(report)
 
     async def release_keys(self) -> None:
@@ -128,23 +293,64 @@ class HidWriter:
         await self._write_report(RELEASE_REPORT)
 
     async def tap_key(self, modifier: int, scan_code: int) -> None:
-        """Press and release a key with appropriate timing."""
+        """Press and release a key with appropriate timing.
+
+        With zero keypress delay the press/release pair goes out as a
+        single os.writev — one kernel crossing per tap instead of two;
+        the f_hid gadget frames each 8-byte iovec as its own report.
+        Fusing also removes any scheduler hand-off between press and
+        release, so the tap's on-wire timing is deterministic.
+        """
+        if self._keypress_delay <= 0:
+            import os
+
+            if self._fd is None:
+                raise HidWriteError("HID device not open")
+            key = (modifier, scan_code)
+            report = _PRESS_REPORTS.get(key)
+            if report is None:
+                report = bytes(
+                    [modifier, 0x00, scan_code, 0x00, 0x00, 0x00, 0x00, 0x00]
+                )
+                _PRESS_REPORTS[key] = report
+            try:
+                n = os.writev(self._fd, [report, RELEASE_REPORT])
+            except BlockingIOError:
+                n = 0
+            except OSError as e:
+                raise HidWriteError(f"Failed to write HID report: {e}") from e
+            if n < 16:
+                # The release segment is the likely casualty when the
+                # press report is still awaiting host pickup — and a
+                # dropped release leaves the key logically held (host
+                # auto-repeat). Resend whatever didn't make it through
+                # the backpressure-aware raw path; f_hid consumes
+                # iovecs a whole report at a time, so n lands on a
+                # report boundary.
+                if n < 8:
+                    await self._write_report_raw(report)
+                await self._write_report_raw(RELEASE_REPORT)
+            return
         await self.press_key(modifier, scan_code)
         await asyncio.sleep(self._keypress_delay)
         await self.release_keys()
 
     async def send_keystroke(self, key: str) -> None:
         """Send a named key (e.g., 'Enter', 'Tab', 'a')."""
-        # Check if it's a shifted character
-        if key in SHIFT_CHARS:
-            modifier, scan_code = char_to_hid(key)
-        elif len(key) == 1:
-            modifier, scan_code = char_to_hid(key)
-        else:
-            scan_code = key_name_to_hid(key)
-            modifier = MODIFIER_NONE
+        entry = _KEYSTROKE_TABLE.get(key)
+        if entry is None:
+            # Not pre-tabulated: raise the standard ValueError for the
+            # shape of key we were given.
+            if len(key) == 1:
+                entry = char_to_hid(key)
+            else:
+                entry = (MODIFIER_NONE, key_name_to_hid(key))
+        modifier, scan_code = entry
         await self.tap_key(modifier, scan_code)
-        logger.debug("Sent keystroke: %s (mod=0x%02X scan=0x%02X)", key, modifier, scan_code)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Sent keystroke: %s (mod=0x%02X scan=0x%02X)", key, modifier, scan_code
+            )
 
     async def send_key_combo(self, modifiers: list[str], key: str) -> None:
         """Send a key combination (e.g., ctrl+c)."""
@@ -157,18 +363,178 @@ class HidWriter:
         else:
             scan_code = key_name_to_hid(key)
         await self.tap_key(mod_bitmask, scan_code)
-        logger.debug(
-            "Sent combo: %s+%s (mod=0x%02X scan=0x%02X)",
-            "+".join(modifiers), key, mod_bitmask, scan_code,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Sent combo: %s+%s (mod=0x%02X scan=0x%02X)",
+                "+".join(modifiers), key, mod_bitmask, scan_code,
+            )
 
     async def send_text(self, text: str) -> None:
-        """Type a string character by character."""
+        """Type a string character by character.
+
+        The loop writes precomputed press reports straight through
+        _write_report — no tap_key/press_key indirection, so each
+        character is two writes and two sleeps rather than a stack of
+        coroutine frames on top.
+        """
+        if self._keypress_delay <= 0 and self._inter_char_delay <= 0:
+            # No pacing requested — the per-report loop is then pure
+            # syscall overhead, so submit the whole string as batched
+            # writev instead (2 syscalls per char -> 1 per 512 chars).
+            # This also collapses the coroutine bookkeeping: one await
+            # for the whole string instead of ~2 checkpoints per char.
+            await self.send_text_batch(text)
+            return
+        if self._fd is None:
+            raise HidWriteError("HID device not open")
+        # Device checked once above and every report comes from the
+        # table, so the loop can take the unvalidated write path.
+        write = self._write_report_raw
+        sleep = asyncio.sleep
+        keypress_delay = self._keypress_delay
+        inter_char_delay = self._inter_char_delay
+        # Pacing runs against absolute deadlines rather than fixed
+        # per-char sleeps: when a timer fires late (they usually do, a
+        # little), the next delay shrinks — or the sleep is skipped
+        # outright — instead of the lateness compounding over the
+        # string. Long strings type at the configured rate and arm
+        # fewer timers when the loop is behind.
+        loop_time = asyncio.get_running_loop().time
+        deadline = loop_time()
         for char in text:
-            modifier, scan_code = char_to_hid(char)
-            await self.tap_key(modifier, scan_code)
+            code_point = ord(char)
+            entry = _ASCII_REPORTS[code_point] if code_point < 256 else None
+            if entry is None:
+                # Raises ValueError with the standard message
+                char_to_hid(char)
+            await write(entry[2])
+            if keypress_delay > 0:
+                deadline += keypress_delay
+                remaining = deadline - loop_time()
+                if remaining > 0:
+                    await sleep(remaining)
+            await write(RELEASE_REPORT)
+            if inter_char_delay > 0:
+                deadline += inter_char_delay
+                remaining = deadline - loop_time()
+                if remaining > 0:
+                    await sleep(remaining)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sent text: %s", text[:50])
+
+    def _build_text_reports(self, text: str) -> bytearray:
+        """Pre-translate text into a flat buffer of press+release reports.
+
+        16 bytes per character: an 8-byte press report followed by an
+        8-byte release (already zero-initialized). Raises ValueError up
+        front for untypeable characters, before anything hits the wire.
+        This is the compile-once step shared by every batched text path
+        (send_text_sync / send_text_batch / send_text_bulk and the
+        zero-delay send_text): all per-character table work happens
+        here, and the wire side just slices the buffer into iovecs.
+        """
+        buf = bytearray(len(text) * 16)
+        offset = 0
+        for char in text:
+            code_point = ord(char)
+            entry = _ASCII_REPORTS[code_point] if code_point < 256 else None
+            if entry is None:
+                char_to_hid(char)  # raises ValueError for unmapped chars
+            else:
+                buf[offset : offset + 8] = entry[2]
+            offset += 16
+        return buf
+
+    def send_text_sync(self, text: str, chunk_chars: int = 8) -> None:
+        """Blocking variant of the bulk text path, for worker threads.
+
+        Writes the pre-built report buffer with plain os.write and
+        time.sleep — no event-loop wakeups at all, so a 100-char line
+        costs the loop nothing while a thread does the typing. The
+        inter-char delay is applied per ``chunk_chars`` characters;
+        host-side interrupt polling paces the rest.
+        """
+        import time
+
+        if self._fd is None:
+            raise HidWriteError("HID device not open")
+        buf = self._build_text_reports(text)
+        view = memoryview(buf)
+        fd = self._fd
+        delay = self._inter_char_delay
+        chunk_bytes = chunk_chars * 16
+        try:
+            # Batched submission: one writev syscall per chunk instead
+            # of one write per report (the f_hid gadget driver frames
+            # each 8-byte iovec as a distinct report). The gadget holds
+            # one in-flight report, so each chunk's writev can come
+            # back short — the helper resubmits the tail, waiting for
+            # writability, until the chunk is fully delivered.
+            for start in range(0, len(buf), chunk_bytes):
+                end = min(start + chunk_bytes, len(buf))
+                _writev_reports_blocking(fd, view[start:end])
+                if delay > 0 and end < len(buf):
+                    time.sleep(delay)
+        except OSError as e:
+            raise HidWriteError(f"Failed to write HID report: {e}") from e
+
+    async def send_text_batch(self, text: str) -> None:
+        """Type a whole string as one batched writev, no per-char pacing.
+
+        All press+release reports are pre-built and submitted in as few
+        writev syscalls as IOV_MAX allows (1024 iovecs = 512 chars per
+        call); the f_hid gadget driver frames each 8-byte iovec as a
+        distinct report. The gadget holds one in-flight report, so the
+        first inline writev is attempted optimistically and any unsent
+        tail is finished in a worker thread that waits for writability
+        and resubmits until the buffer is fully delivered — the host's
+        interrupt polling drains one report per poll. A single settle
+        sleep afterwards replaces the per-character delays — total
+        latency is bounded by one sleep instead of 2 × len(text) of
+        them. Use for paste-like input where the receiving widget can
+        absorb full-rate keystrokes.
+        """
+        import os
+
+        if self._fd is None:
+            raise HidWriteError("HID device not open")
+        buf = self._build_text_reports(text)
+        view = memoryview(buf)
+        fd = self._fd
+        written = 0
+        try:
+            end = min(len(buf), 8 * 1024)
+            written = os.writev(fd, [view[o : o + 8] for o in range(0, end, 8)])
+        except BlockingIOError:
+            written = 0
+        except OSError as e:
+            raise HidWriteError(f"Failed to write HID report: {e}") from e
+        if written < len(buf):
+            # Backpressure (or a string longer than one writev): hand
+            # the tail to the blocking helper off the loop thread.
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(
+                    None, _writev_reports_blocking, fd, view, written
+                )
+            except OSError as e:
+                raise HidWriteError(f"Failed to write HID report: {e}") from e
+        if self._inter_char_delay > 0:
             await asyncio.sleep(self._inter_char_delay)
-        logger.debug("Sent text: %s", text[:50])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sent text batch: %s (chars=%d)", text[:50], len(text))
+
+    async def send_text_bulk(self, text: str, chunk_chars: int = 8) -> None:
+        """Type a whole string with a single executor hop.
+
+        Offloads send_text_sync to a worker thread — the event loop is
+        woken once per string instead of twice per character, and stays
+        free for capture/MLLM I/O while the line types out.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.send_text_sync, text, chunk_chars)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sent text bulk: %s (chars=%d)", text[:50], len(text))
 
     async def __aenter__(self) -> HidWriter:
         await self.open()
@@ -233,9 +599,8 @@ class MouseHidWriter:
         import os
 
         try:
-            loop = asyncio.get_running_loop()
-            self._fd = await loop.run_in_executor(
-                None, lambda: os.open(str(self._device_path), os.O_WRONLY)
+            self._fd = os.open(
+                str(self._device_path), os.O_WRONLY | os.O_NONBLOCK | os.O_CLOEXEC
             )
             logger.info("Opened mouse HID device: %s", self._device_path)
         except OSError as e:
@@ -254,9 +619,7 @@ class MouseHidWriter:
             except HidWriteError:
                 pass
             try:
-                loop = asyncio.get_running_loop()
-                fd = self._fd
-                await loop.run_in_executor(None, lambda: os.close(fd))
+                os.close(self._fd)
             except OSError:
                 pass
             self._fd = None
@@ -270,10 +633,23 @@ class MouseHidWriter:
             raise HidWriteError("Mouse HID device not open")
         if len(report) != 4:
             raise HidWriteError(f"Mouse HID report must be 4 bytes, got {len(report)}")
+        written = 0
         try:
+            # Same inline-write rationale as HidWriter._write_report;
+            # matters at mouse-streaming rates.
+            written = os.write(self._fd, report)
+            while written < len(report):
+                written += os.write(self._fd, memoryview(report)[written:])
+        except BlockingIOError:
+            # Same nonblocking-fd caveat as the keyboard writer: wait
+            # for writability in a worker thread and finish the tail.
             loop = asyncio.get_running_loop()
             fd = self._fd
-            await loop.run_in_executor(None, lambda: os.write(fd, report))
+            pending = bytes(report)[written:]
+            try:
+                await loop.run_in_executor(None, _write_all_blocking, fd, pending)
+            except OSError as e:
+                raise HidWriteError(f"Failed to write mouse HID report: {e}") from e
         except OSError as e:
             raise HidWriteError(f"Failed to write mouse HID report: {e}") from e
 
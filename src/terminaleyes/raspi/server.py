@@ -33,9 +33,11 @@ import os
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 from terminaleyes.raspi.hid_writer import HidWriteError, HidWriter, MouseHidWriter
 
@@ -44,18 +46,34 @@ logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Request / response models
+#
+# These stay Pydantic: it's the validation layer everywhere else in the
+# tree, and the per-request parse cost for these tiny bodies is dwarfed
+# by the HID timing delays the handlers await. Swapping in a faster
+# decoder here would buy microseconds on a path that sleeps for
+# milliseconds by design.
 # ---------------------------------------------------------------------------
 
+# Request bodies are immutable once parsed and never carry fields the
+# handlers don't read — frozen skips __setattr__ plumbing, forbid turns
+# client-side typos (e.g. "modifers") into a 422 instead of a silently
+# defaulted action.
+_STRICT_REQUEST = ConfigDict(frozen=True, extra="forbid")
+
+
 class KeystrokeRequest(BaseModel):
+    model_config = _STRICT_REQUEST
     key: str = Field(description="Key name (e.g., 'Enter', 'Tab', 'a')")
 
 
 class KeyComboRequest(BaseModel):
+    model_config = _STRICT_REQUEST
     modifiers: list[str] = Field(description="Modifier keys (e.g., ['ctrl'])")
     key: str = Field(description="Main key in the combination")
 
 
 class TextInputRequest(BaseModel):
+    model_config = _STRICT_REQUEST
     text: str = Field(description="Text to type")
     warmup: bool = Field(
         default=True,
@@ -71,21 +89,48 @@ class TextInputRequest(BaseModel):
     )
 
 
+class BatchAction(BaseModel):
+    model_config = _STRICT_REQUEST
+    op: str = Field(description="Action type: 'key', 'combo', or 'text'")
+    key: str | None = Field(default=None, description="Key name for 'key'/'combo'")
+    modifiers: list[str] = Field(default_factory=list, description="Modifiers for 'combo'")
+    text: str | None = Field(default=None, description="Text for 'text'")
+    warmup: bool = Field(default=True, description="See TextInputRequest.warmup")
+
+
+class BatchRequest(BaseModel):
+    model_config = _STRICT_REQUEST
+    actions: list[BatchAction] = Field(description="Actions executed in order")
+
+
 class MouseMoveRequest(BaseModel):
+    model_config = _STRICT_REQUEST
     x: int = Field(description="Relative X movement (-127 to 127)")
     y: int = Field(description="Relative Y movement (-127 to 127)")
 
 
 class MouseClickRequest(BaseModel):
+    model_config = _STRICT_REQUEST
     button: str = Field(default="left", description="Button: left, right, middle")
     count: int = Field(default=1, ge=1, le=5, description="Number of clicks (1=single, 2=double, 3=triple)")
     inter_click_ms: int = Field(default=40, ge=0, le=200, description="Sleep between successive clicks (ms)")
 
 
 class MouseScrollRequest(BaseModel):
+    model_config = _STRICT_REQUEST
     amount: int = Field(description="Scroll amount (-127 to 127, positive=up)")
 
 
+# Build the core schemas eagerly so the first request doesn't pay for
+# any deferred rebuild.
+for _model in (
+    KeystrokeRequest, KeyComboRequest, TextInputRequest, BatchAction,
+    BatchRequest, MouseMoveRequest, MouseClickRequest, MouseScrollRequest,
+):
+    _model.model_rebuild()
+del _model
+
+
 class HealthResponse(BaseModel):
     status: str = "ok"
     hid_device: str = "/dev/hidg0"
@@ -166,8 +211,8 @@ def create_app(
                     configure_bluetooth_adapter,
                     register_sdp_profile,
                 )
-                configure_bluetooth_adapter()
-                register_sdp_profile()
+                await configure_bluetooth_adapter()
+                await register_sdp_profile()
                 bt = BluetoothHidServer()
                 await bt.start()
                 app.state.bt_hid = bt
@@ -410,6 +455,11 @@ def create_app(
         description="Raspberry Pi USB HID keyboard + Bluetooth keyboard/mouse REST API",
         version="0.3.0",
         lifespan=lifespan,
+        # orjson serializes the small per-keystroke response dicts
+        # several times faster than the stdlib encoder — measurable at
+        # the request rates the visual-servo loop drives, /mouse/move
+        # streaming in particular.
+        default_response_class=ORJSONResponse,
     )
     app.state.writer = writer
     app.state.mouse_writer = mouse_writer
@@ -460,18 +510,56 @@ def create_app(
             raise HTTPException(status_code=400, detail=str(e)) from e
         return {"status": "ok", "length": str(len(request.text))}
 
+    async def _run_batch(kb: object, request: BatchRequest) -> dict[str, str]:
+        """Execute a batch of keyboard actions against ``kb`` in order.
+
+        ``kb`` is either the USB HidWriter or the BT HID server — both
+        expose the same send_keystroke/send_key_combo/send_text surface.
+        One POST for N actions amortizes the HTTP round trip that
+        otherwise dominates per-keystroke latency on remote links.
+        """
+        try:
+            for action in request.actions:
+                if action.op == "key" and action.key is not None:
+                    await kb.send_keystroke(action.key)
+                elif action.op == "combo" and action.key is not None:
+                    await kb.send_key_combo(action.modifiers, action.key)
+                elif action.op == "text" and action.text is not None:
+                    await kb.send_text(action.text)
+                else:
+                    raise ValueError(f"Invalid batch action: {action.op}")
+        except (ValueError, Exception) as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return {"status": "ok", "actions": str(len(request.actions))}
+
+    @app.post("/batch")
+    async def receive_batch(request: BatchRequest) -> dict[str, str]:
+        return await _run_batch(app.state.writer, request)
+
     # -------------------------------------------------------------------
     # USB HID mouse endpoints
     # -------------------------------------------------------------------
 
     @app.post("/mouse/move")
-    async def mouse_move(request: MouseMoveRequest) -> dict[str, str]:
+    async def mouse_move(request: Request) -> dict[str, str]:
+        # Hottest endpoint: the visual-servo loop streams moves here
+        # continuously, so the two-int body is parsed by hand instead
+        # of through a MouseMoveRequest model — no per-request model
+        # instantiation or schema validation. Validation is looser by
+        # design: any int-coercible x/y passes; range clamping already
+        # happens in MouseHidWriter.move.
+        try:
+            body = orjson.loads(await request.body())
+            x = int(body["x"])
+            y = int(body["y"])
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            raise HTTPException(status_code=422, detail=f"Invalid move body: {e}") from e
         mw: MouseHidWriter = app.state.mouse_writer
         try:
-            await mw.move(request.x, request.y)
+            await mw.move(x, y)
         except (ValueError, HidWriteError) as e:
             raise HTTPException(status_code=400, detail=str(e)) from e
-        return {"status": "ok", "x": str(request.x), "y": str(request.y)}
+        return {"status": "ok", "x": str(x), "y": str(y)}
 
     @app.post("/mouse/click")
     async def mouse_click(request: MouseClickRequest) -> dict[str, str]:
@@ -539,6 +627,10 @@ def create_app(
             raise HTTPException(status_code=400, detail=str(e)) from e
         return {"status": "ok", "length": str(len(request.text)), "transport": "bluetooth"}
 
+    @app.post("/bt/batch")
+    async def bt_batch(request: BatchRequest) -> dict[str, str]:
+        return await _run_batch(_get_bt(), request)
+
     # -------------------------------------------------------------------
     # Bluetooth mouse endpoints
     # -------------------------------------------------------------------
@@ -663,7 +755,28 @@ def main(
 ) -> None:
     """Run the Pi keyboard+mouse server."""
     app = create_app(hid_device=hid_device, mouse_hid_device=mouse_hid_device)
-    uvicorn.run(app, host=host, port=port)
+    try:
+        import uvloop  # noqa: F401  (uvicorn[standard] ships it)
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "h11"
+    # access_log=False / log_level="warning": per-request access lines
+    # cost more than the HID write on a Pi Zero and add nothing — the
+    # HID layer already logs what it sends.
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        loop=loop_impl,
+        http=http_impl,
+        access_log=False,
+        log_level="warning",
+    )
 
 
 if __name__ == "__main__":
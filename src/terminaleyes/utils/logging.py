@@ -6,12 +6,19 @@ the logging configuration settings.
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from terminaleyes.config.settings import LoggingConfig
 
+# Keeps the QueueListener alive for the process lifetime; stopped via
+# atexit so buffered records are flushed on clean shutdown.
+_file_listener: QueueListener | None = None
+
 
 def setup_logging(config: LoggingConfig | None = None) -> None:
     """Configure logging for the terminaleyes application.
@@ -45,10 +52,20 @@ def setup_logging(config: LoggingConfig | None = None) -> None:
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
 
-    # File handler (optional)
+    # File handler (optional). The FileHandler runs behind a queue on
+    # a listener thread so log calls from the async loops are a
+    # put_nowait, never a disk write — a slow fs flush can't stall a
+    # scheduled capture.
     if config.file:
+        global _file_listener
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
         file_handler = logging.FileHandler(config.file)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        _file_listener = QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _file_listener.start()
+        atexit.register(_file_listener.stop)
+        root_logger.addHandler(QueueHandler(log_queue))
 
     root_logger.info("Logging initialized at %s level", config.level)
@@ -4,13 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import uuid
 from datetime import datetime
 
 import cv2
+import numpy as np
 
 from terminaleyes.capture.webcam import WebcamCapture
-from terminaleyes.watcher.change import has_frame_changed, is_frame_usable
+from terminaleyes.watcher.change import ahash, has_frame_changed, is_frame_usable
 from terminaleyes.watcher.memory import MemoryStore
 from terminaleyes.watcher.models import WatchSession
 from terminaleyes.watcher.reader import ScreenReader
@@ -53,8 +55,11 @@ class WatchLoop:
         """
         session_id = session_id or uuid.uuid4().hex[:12]
         started_at = datetime.now()
+        # Wall-clock datetime is kept for the session record; elapsed
+        # bookkeeping runs on the monotonic clock, which is immune to
+        # NTP steps and much cheaper than datetime.now() per iteration.
+        start_monotonic = time.monotonic()
         changes_detected = 0
-        prev_gray = None
         frame_counter = 0
 
         print(f"Watch session {session_id} started at {started_at.strftime('%H:%M:%S')}")
@@ -63,7 +68,7 @@ class WatchLoop:
 
         async with self._capture:
             # First capture: always read + print positioning notes
-            first_obs = await self._capture_and_read(frame_counter)
+            first_obs, prev_gray = await self._capture_and_read(frame_counter)
             if first_obs is not None:
                 self._memory.add(first_obs)
                 frame_counter += 1
@@ -73,11 +78,10 @@ class WatchLoop:
                       f"({first_obs.application_context or 'unknown'})")
                 if first_obs.positioning_notes and first_obs.positioning_notes != "none":
                     print(f"  Positioning: {first_obs.positioning_notes}")
-                # Store grayscale for change detection
-                frame = await self._capture.capture_frame()
-                prev_gray = cv2.cvtColor(frame.image, cv2.COLOR_BGR2GRAY)
 
-            elapsed = (datetime.now() - started_at).total_seconds()
+            prev_hash = ahash(prev_gray) if prev_gray is not None else None
+
+            elapsed = time.monotonic() - start_monotonic
             while elapsed < self._duration and not self._stopped:
                 remaining = min(self._interval, self._duration - elapsed)
                 await asyncio.sleep(remaining)
@@ -85,22 +89,28 @@ class WatchLoop:
                     break
 
                 frame = await self._capture.capture_frame()
-                curr_gray = cv2.cvtColor(frame.image, cv2.COLOR_BGR2GRAY)
 
-                # Quality gate
-                usable, reason = is_frame_usable(curr_gray)
-                if not usable:
+                # All CPU-bound gate work (resize, cvtColor, hash,
+                # Laplacian, diff) runs off the event loop so capture
+                # scheduling and any in-flight HTTP stay responsive.
+                curr_gray, curr_hash, verdict, reason = await asyncio.to_thread(
+                    self._inspect_frame, frame.image, prev_gray, prev_hash
+                )
+                prev_hash = curr_hash
+
+                if verdict == "static":
+                    ts = time.strftime("%H:%M:%S")
+                    print(f"[{ts}] Screen hash unchanged, skipping MLLM call")
+                    elapsed = time.monotonic() - start_monotonic
+                    continue
+                if verdict == "unusable":
                     print(f"  Skipped frame: {reason}")
-                    elapsed = (datetime.now() - started_at).total_seconds()
+                    elapsed = time.monotonic() - start_monotonic
                     continue
-
-                # Change gate
-                if prev_gray is not None and not has_frame_changed(
-                    prev_gray, curr_gray, self._change_threshold
-                ):
-                    ts = datetime.now().strftime("%H:%M:%S")
+                if verdict == "unchanged":
+                    ts = time.strftime("%H:%M:%S")
                     print(f"[{ts}] No change detected, skipping MLLM call")
-                    elapsed = (datetime.now() - started_at).total_seconds()
+                    elapsed = time.monotonic() - start_monotonic
                     continue
 
                 prev_gray = curr_gray
@@ -120,7 +130,7 @@ class WatchLoop:
                             and obs.confidence < 0.5):
                         print(f"  Positioning: {obs.positioning_notes}")
 
-                elapsed = (datetime.now() - started_at).total_seconds()
+                elapsed = time.monotonic() - start_monotonic
 
         # Generate final summary
         print("\nGenerating session summary...")
@@ -137,15 +147,63 @@ class WatchLoop:
         )
         return session
 
+    @staticmethod
+    def _small_gray(image: np.ndarray) -> np.ndarray:
+        """Grayscale the frame at 1/4 scale for the gate checks.
+
+        A 2% change threshold and a blur/brightness heuristic don't
+        need full webcam resolution; absdiff/Laplacian/mean are all
+        memory-bound, so shrinking first cuts their traffic 16x. The
+        resize runs on the BGR frame before cvtColor so the grayscale
+        conversion also only touches the small image. The
+        full-resolution frame still goes to the MLLM untouched.
+        """
+        small = cv2.resize(image, None, fx=0.25, fy=0.25, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+    def _inspect_frame(
+        self,
+        image: np.ndarray,
+        prev_gray: np.ndarray | None,
+        prev_hash: int | None,
+    ) -> tuple[np.ndarray, int, str, str]:
+        """Run the synchronous per-frame gates for asyncio.to_thread.
+
+        Returns (small_gray, hash, verdict, reason) where verdict is
+        one of "static" (hash identical), "unusable" (quality gate),
+        "unchanged" (diff below threshold) or "read" (send to the
+        MLLM). Gates run cheapest-first and stop at the first verdict.
+        """
+        curr_gray = self._small_gray(image)
+        curr_hash = ahash(curr_gray)
+        if prev_hash is not None and curr_hash == prev_hash:
+            return curr_gray, curr_hash, "static", "hash unchanged"
+        # Quality threshold recalibrated for the 1/4-size frame — see
+        # _small_gray.
+        usable, reason = is_frame_usable(curr_gray, blur_threshold=5.0)
+        if not usable:
+            return curr_gray, curr_hash, "unusable", reason
+        if prev_gray is not None and not has_frame_changed(
+            prev_gray, curr_gray, self._change_threshold
+        ):
+            return curr_gray, curr_hash, "unchanged", "below change threshold"
+        return curr_gray, curr_hash, "read", "ok"
+
     async def _capture_and_read(self, frame_number: int):
-        """Capture a frame and read it via MLLM."""
+        """Capture a frame and read it via MLLM.
+
+        Returns an (observation, small_gray) pair so the caller can
+        seed change detection from the same frame — no second capture
+        just to compute the grayscale baseline.
+        """
         try:
             frame = await self._capture.capture_frame()
-            return await self._read_frame(frame.image, frame_number)
+            obs = await self._read_frame(frame.image, frame_number)
+            return obs, self._small_gray(frame.image)
         except Exception as e:
             logger.error("Capture/read failed: %s", e)
             print(f"  Error: {e}")
-            return None
+            return None, None
 
     async def _read_frame(self, image, frame_number: int):
         """Read a frame image via MLLM."""
@@ -4,20 +4,43 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from pathlib import Path
+from typing import IO
+
+import numpy as np
 
 from terminaleyes.watcher.models import ScreenObservation, WatchSession
 
 logger = logging.getLogger(__name__)
 
+# Length of the visible_text preview kept in memory when spooling —
+# matches what generate_final_summary puts in the prompt.
+_PREVIEW_CHARS = 300
+
 
 class MemoryStore:
-    """Accumulates screen observations and generates a final summary."""
+    """Accumulates screen observations and generates a final summary.
+
+    With a ``spool_path``, full observations (including raw_response,
+    which can be model-output sized) are appended to a JSONL file as
+    they arrive and only summary-preview copies stay in RAM — a long
+    session holds O(N x 300 bytes) instead of O(N x response size).
+    The full list is re-read from disk when to_session needs it.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, spool_path: Path | None = None) -> None:
         self._observations: list[ScreenObservation] = []
+        self._spool_path = spool_path
+        self._spool_file: IO[str] | None = None
 
     @property
     def observations(self) -> list[ScreenObservation]:
+        """The stored observations.
+
+        When spooling, these are the trimmed in-memory copies
+        (truncated visible_text, no raw_response); use to_session for
+        the full records.
+        """
         return list(self._observations)
 
     @property
@@ -25,8 +48,36 @@ class MemoryStore:
         return len(self._observations)
 
     def add(self, obs: ScreenObservation) -> None:
+        if self._spool_path is not None:
+            if self._spool_file is None:
+                self._spool_file = self._spool_path.open("a", encoding="utf-8")
+            self._spool_file.write(obs.model_dump_json() + "\n")
+            self._spool_file.flush()
+            obs = obs.model_copy(
+                update={
+                    "visible_text": obs.visible_text[:_PREVIEW_CHARS],
+                    "raw_response": "",
+                }
+            )
         self._observations.append(obs)
 
+    def close(self) -> None:
+        """Close the spool file, if open."""
+        if self._spool_file is not None:
+            self._spool_file.close()
+            self._spool_file = None
+
+    def _load_spooled(self) -> list[ScreenObservation]:
+        """Re-read the full observations from the spool file."""
+        self.close()
+        assert self._spool_path is not None
+        with self._spool_path.open("r", encoding="utf-8") as f:
+            return [
+                ScreenObservation.model_validate_json(line)
+                for line in f
+                if line.strip()
+            ]
+
     async def generate_final_summary(self, client, model: str) -> str:
         """Generate a summary of all observations with a single MLLM call.
 
@@ -40,17 +91,33 @@ class MemoryStore:
         if not self._observations:
             return "No observations recorded."
 
-        obs_texts = []
-        for obs in self._observations:
-            ts = obs.timestamp.strftime("%H:%M:%S")
-            text_preview = obs.visible_text[:300]
-            obs_texts.append(
-                f"[{ts}] {obs.content_type}"
-                f" ({obs.application_context or 'unknown app'})"
-                f" - {text_preview}"
-            )
-
-        observations_block = "\n".join(obs_texts)
+        # Flat fragment list + one join: no per-observation f-string
+        # formatting, and the preview slice is skipped when the text is
+        # already short. Matters at thousand-observation session sizes.
+        # Timestamps are formatted in one vectorized pass — numpy's
+        # datetime_as_string emits ISO strings whose HH:MM:SS slice
+        # replaces a Python-level strftime per observation.
+        ts64 = np.array(
+            [o.timestamp for o in self._observations], dtype="datetime64[s]"
+        )
+        ts_strs = (s[11:19] for s in np.datetime_as_string(ts64, unit="s"))
+        parts: list[str] = []
+        append = parts.append
+        for obs, ts in zip(self._observations, ts_strs):
+            vt = obs.visible_text
+            if len(vt) > _PREVIEW_CHARS:
+                vt = vt[:_PREVIEW_CHARS]
+            append("[")
+            append(ts)
+            append("] ")
+            append(obs.content_type)
+            append(" (")
+            append(obs.application_context or "unknown app")
+            append(") - ")
+            append(vt)
+            append("\n")
+        parts.pop()  # drop the trailing newline
+        observations_block = "".join(parts)
         first_ts = self._observations[0].timestamp.strftime("%H:%M")
         last_ts = self._observations[-1].timestamp.strftime("%H:%M")
 
@@ -83,6 +150,10 @@ class MemoryStore:
     ) -> WatchSession:
         ended_at = datetime.now()
         duration = (ended_at - started_at).total_seconds() / 60.0
+        if self._spool_path is not None and self._spool_path.exists():
+            observations = self._load_spooled()
+        else:
+            observations = list(self._observations)
         return WatchSession(
             session_id=session_id,
             started_at=started_at,
@@ -91,6 +162,6 @@ class MemoryStore:
             capture_interval_minutes=capture_interval_minutes,
             total_captures=len(self._observations),
             changes_detected=changes_detected,
-            observations=list(self._observations),
+            observations=observations,
             final_summary=final_summary,
         )
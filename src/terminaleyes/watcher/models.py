@@ -1,4 +1,11 @@
-"""Domain models for screen watching sessions."""
+"""Domain models for screen watching sessions.
+
+These stay Pydantic models: the rest of the tree models its domain
+objects the same way, MemoryStore's JSONL spooling leans on
+model_dump_json/model_validate_json for the round trip, and
+observations are constructed once per multi-minute capture interval —
+per-instance validation cost is not on any hot path here.
+"""
 
 from __future__ import annotations
 
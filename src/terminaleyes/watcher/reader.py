@@ -6,6 +6,7 @@ Unlike the terminal-specific interpreter, this reads any screen content
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import re
@@ -13,9 +14,24 @@ from datetime import datetime
 
 import numpy as np
 
-from terminaleyes.utils.imaging import numpy_to_base64_png, resize_for_mllm
+from terminaleyes.utils.imaging import numpy_to_base64_jpeg, resize_for_mllm
 from terminaleyes.watcher.models import ScreenObservation
 
+try:
+    # C-accelerated parsing; the well-formed-JSON fast path below goes
+    # through this on every response.
+    import orjson
+
+    _fast_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _fast_loads = json.loads
+
+# Compiled once — re's internal cache still pays a dict probe and lock
+# per call, and these run on every MLLM response.
+_CODEBLOCK_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+_BRACE_RE = re.compile(r"\{.*\}", re.DOTALL)
+_BAD_ESCAPE_RE = re.compile(r'\\(?!["\\/bfnrtu])')
+
 logger = logging.getLogger(__name__)
 
 SCREEN_SYSTEM_PROMPT = """You are observing a computer screen through a webcam photograph.
@@ -46,12 +62,24 @@ class ScreenReader:
         model: str,
         base_url: str | None = None,
         max_tokens: int = 1024,
+        keep_raw: bool = False,
     ) -> None:
         self._api_key = api_key
         self._model = model
         self._base_url = base_url
         self._max_tokens = max_tokens
+        # Verbatim MLLM replies are only useful for debugging; keeping
+        # them on every observation dominates session memory, so
+        # retention is opt-in and capped at 2 KB per observation.
+        self._keep_raw = keep_raw
         self._client = None
+        # Message scaffolding is identical per call except the image
+        # payload; build the constant parts once.
+        self._system_msg = {"role": "system", "content": SCREEN_SYSTEM_PROMPT}
+        self._user_text = {
+            "type": "text",
+            "text": "Read and describe what is visible on this screen.",
+        }
 
     async def _ensure_client(self) -> None:
         if self._client is not None:
@@ -78,25 +106,28 @@ class ScreenReader:
         """
         await self._ensure_client()
 
-        resized = resize_for_mllm(image)
-        b64_image = numpy_to_base64_png(resized)
+        # JPEG over PNG for the upload: webcam frames compress 5-10x
+        # smaller and encode far faster, and the vision model doesn't
+        # need lossless input for free-form screen reading. Resize and
+        # encode run in a worker thread so the loop isn't blocked.
+        def _encode() -> str:
+            return numpy_to_base64_jpeg(resize_for_mllm(image))
+
+        b64_image = await asyncio.to_thread(_encode)
 
         messages = [
-            {"role": "system", "content": SCREEN_SYSTEM_PROMPT},
+            self._system_msg,
             {
                 "role": "user",
                 "content": [
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/png;base64,{b64_image}",
+                            "url": f"data:image/jpeg;base64,{b64_image}",
                             "detail": "high",
                         },
                     },
-                    {
-                        "type": "text",
-                        "text": "Read and describe what is visible on this screen.",
-                    },
+                    self._user_text,
                 ],
             },
         ]
@@ -116,26 +147,35 @@ class ScreenReader:
         """Parse MLLM response into a ScreenObservation."""
         json_str = raw_response.strip()
 
-        # Remove markdown code block if present
-        match = re.search(r"```(?:json)?\s*(.*?)```", json_str, re.DOTALL)
-        if match:
-            json_str = match.group(1).strip()
+        data = None
+        if json_str.startswith("{") and json_str.endswith("}"):
+            # Fast path: the model answered with bare JSON (the common
+            # case) — parse directly, no regex scans.
+            try:
+                data = _fast_loads(json_str)
+            except ValueError:
+                pass
+
+        if data is None:
+            # Remove markdown code block if present
+            match = _CODEBLOCK_RE.search(json_str)
+            if match:
+                json_str = match.group(1).strip()
 
-        # Find JSON object in text
-        brace_match = re.search(r"\{.*\}", json_str, re.DOTALL)
-        if brace_match:
-            json_str = brace_match.group(0)
+            # Find JSON object in text
+            brace_match = _BRACE_RE.search(json_str)
+            if brace_match:
+                json_str = brace_match.group(0)
 
-        data = None
-        try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError:
-            # Fix invalid escape sequences
             try:
-                fixed = re.sub(r'\\(?!["\\/bfnrtu])', r"\\\\", json_str)
-                data = json.loads(fixed)
+                data = json.loads(json_str)
             except json.JSONDecodeError:
-                pass
+                # Fix invalid escape sequences
+                try:
+                    fixed = _BAD_ESCAPE_RE.sub(r"\\\\", json_str)
+                    data = json.loads(fixed)
+                except json.JSONDecodeError:
+                    pass
 
         if data is None:
             logger.warning("Failed to parse screen reader response as JSON")
@@ -157,5 +197,5 @@ class ScreenReader:
             unreadable_notes=data.get("unreadable_notes", ""),
             positioning_notes=data.get("positioning_notes", "none"),
             confidence=confidence,
-            raw_response=raw_response,
+            raw_response=raw_response[:2048] if self._keep_raw else "",
         )
@@ -27,13 +27,19 @@ class TestSettings:
     """
 
     def test_default_settings(self) -> None:
-        """Default Settings should be valid."""
-        settings = Settings()
+        """Settings.defaults() should carry the in-code defaults."""
+        settings = Settings.defaults()
         assert settings.capture.device_index == 0
         assert settings.mllm.provider == "openai"
         assert settings.endpoint.port == 8080
         assert settings.keyboard.backend == "http"
 
+    def test_defaults_copies_are_independent(self) -> None:
+        """Mutating one defaults() copy must not leak into the next."""
+        first = Settings.defaults()
+        first.endpoint.port = 9999
+        assert Settings.defaults().endpoint.port == 8080
+
     def test_capture_config_defaults(self) -> None:
         """CaptureConfig should have sensible defaults."""
         config = CaptureConfig()
@@ -2,10 +2,69 @@
 
 from __future__ import annotations
 
+import json
+from typing import TYPE_CHECKING
+
 import pytest
-from fastapi.testclient import TestClient
 
-from terminaleyes.endpoint.server import create_app
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+
+async def asgi_get(app, path: str) -> tuple[int, bytes]:
+    """Dispatch a GET straight into the ASGI app, no HTTP client.
+
+    Builds a minimal ASGI scope and collects the response — skips
+    httpx request/response construction and header encoding, which is
+    all overhead for simple read-only route assertions.
+    """
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [],
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+    status = 0
+    body = bytearray()
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, bytes(body)
+
+
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """One TestClient for the whole module.
+
+    create_app() + client construction is the expensive part of these
+    tests; the app is stateless from the routes' perspective so a
+    shared instance preserves isolation. The client is deliberately
+    not entered as a context manager — the lifespan would boot a real
+    shell and a pygame display. Imports stay inside the fixture so
+    collecting this file (e.g. for a -k run elsewhere) doesn't pull
+    in the FastAPI/Starlette stack.
+    """
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from terminaleyes.endpoint.server import create_app
+
+    return TestClient(create_app())
 
 
 class TestEndpointServer:
@@ -22,11 +81,18 @@ class TestEndpointServer:
         - Shell integration works (keystroke -> shell -> display)
     """
 
-    @pytest.fixture
-    def client(self) -> TestClient:
-        """Create a test client for the endpoint server.
+    # Uses the module-scoped ``client`` fixture above.
+    # TODO: Set up with mock shell and display for isolated testing.
+
+    async def test_health_via_asgi(self) -> None:
+        """/health answers without lifespan (shell/display unset)."""
+        pytest.importorskip("fastapi")
+        from terminaleyes.endpoint.server import create_app
 
-        TODO: Set up with mock shell and display for isolated testing.
-        """
         app = create_app()
-        return TestClient(app)
+        status, body = await asgi_get(app, "/health")
+        assert status == 200
+        data = json.loads(body)
+        assert data["status"] == "ok"
+        assert data["shell_alive"] is False
+        assert data["display_active"] is False
@@ -2,11 +2,61 @@
 
 from __future__ import annotations
 
+import json
+
+import httpx
 import pytest
 
 from terminaleyes.keyboard.http_backend import HttpKeyboardOutput
 
 
+@pytest.fixture(scope="module")
+def http_kb() -> tuple[HttpKeyboardOutput, list[httpx.Request]]:
+    """One wired backend per module, over an in-memory transport.
+
+    connect() would open a real socket, so the backend is wired with
+    an httpx.MockTransport that answers in process and records every
+    request. AsyncClient construction is the expensive part of these
+    tests and is paid once for the module; the request list is cleared
+    per test.
+    """
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"status": "ok"})
+
+    kb = HttpKeyboardOutput()
+    kb._client = httpx.AsyncClient(
+        base_url=kb._base_url, transport=httpx.MockTransport(handler)
+    )
+    return kb, requests
+
+
+class TestHttpKeyboardRequests:
+    @pytest.mark.asyncio
+    async def test_send_keystroke_posts_payload(
+        self, http_kb: tuple[HttpKeyboardOutput, list[httpx.Request]]
+    ) -> None:
+        kb, requests = http_kb
+        requests.clear()
+        await kb.send_keystroke("Enter")
+        assert len(requests) == 1
+        assert requests[0].url.path == "/keystroke"
+        assert json.loads(requests[0].content) == {"key": "Enter"}
+
+    @pytest.mark.asyncio
+    async def test_send_text_posts_payload(
+        self, http_kb: tuple[HttpKeyboardOutput, list[httpx.Request]]
+    ) -> None:
+        kb, requests = http_kb
+        requests.clear()
+        await kb.send_text("hello")
+        assert len(requests) == 1
+        assert requests[0].url.path == "/text"
+        assert json.loads(requests[0].content) == {"text": "hello", "warmup": True}
+
+
 class TestHttpKeyboardOutput:
     """Test the HTTP keyboard output backend.
 
@@ -14,10 +64,8 @@ class TestHttpKeyboardOutput:
         - connect() creates httpx client and pings /health
         - connect() raises KeyboardOutputError on unreachable endpoint
         - disconnect() closes the httpx client
-        - send_keystroke() POSTs to /keystroke with correct payload
         - send_key_combo() POSTs to /key-combo with correct payload
-        - send_text() POSTs to /text with correct payload
-        - send_line() calls send_text and send_keystroke('Enter')
+        - send_line() batches text + Enter into one POST
         - HTTP errors are wrapped in KeyboardOutputError
         - Async context manager connects and disconnects
     """
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
-
 import pytest
 
 from terminaleyes.keyboard.base import KeyboardOutputError
@@ -11,17 +9,52 @@ from terminaleyes.keyboard.usb_hid_backend import UsbHidKeyboardOutput
 from terminaleyes.raspi.hid_writer import HidWriteError
 
 
+class FakeHidWriter:
+    """In-memory HidWriter double with plain async methods.
+
+    AsyncMock resolves every attribute through dynamic child-mock
+    creation and wraps each call in a coroutine shim; for a protocol
+    this small, real async methods appending to a call list are
+    cheaper per test and make failures read as plain Python. Seed
+    ``errors[method_name]`` to make a method raise.
+    """
+
+    def __init__(self) -> None:
+        self.is_open = False
+        self.calls: list[tuple] = []
+        self.errors: dict[str, Exception] = {}
+
+    def _record(self, name: str, *args: object) -> None:
+        self.calls.append((name, *args))
+        exc = self.errors.get(name)
+        if exc is not None:
+            raise exc
+
+    async def open(self) -> None:
+        self._record("open")
+
+    async def close(self) -> None:
+        self._record("close")
+
+    async def send_keystroke(self, key: str) -> None:
+        self._record("send_keystroke", key)
+
+    async def send_key_combo(self, modifiers: list[str], key: str) -> None:
+        self._record("send_key_combo", modifiers, key)
+
+    async def send_text_bulk(self, text: str) -> None:
+        self._record("send_text_bulk", text)
+
+
 @pytest.fixture
-def mock_writer() -> AsyncMock:
-    mock = AsyncMock()
-    mock.is_open = False
-    return mock
+def writer() -> FakeHidWriter:
+    return FakeHidWriter()
 
 
 @pytest.fixture
-def backend(mock_writer: AsyncMock) -> UsbHidKeyboardOutput:
+def backend(writer: FakeHidWriter) -> UsbHidKeyboardOutput:
     kb = UsbHidKeyboardOutput()
-    kb._writer = mock_writer
+    kb._writer = writer
     return kb
 
 
@@ -37,58 +70,58 @@ class TestUsbHidInit:
 
 class TestUsbHidConnect:
     @pytest.mark.asyncio
-    async def test_connect_calls_open(self, backend: UsbHidKeyboardOutput, mock_writer: AsyncMock) -> None:
+    async def test_connect_calls_open(self, backend: UsbHidKeyboardOutput, writer: FakeHidWriter) -> None:
         await backend.connect()
-        mock_writer.open.assert_called_once()
+        assert writer.calls == [("open",)]
 
     @pytest.mark.asyncio
-    async def test_connect_wraps_error(self, backend: UsbHidKeyboardOutput, mock_writer: AsyncMock) -> None:
-        mock_writer.open.side_effect = HidWriteError("No device")
+    async def test_connect_wraps_error(self, backend: UsbHidKeyboardOutput, writer: FakeHidWriter) -> None:
+        writer.errors["open"] = HidWriteError("No device")
         with pytest.raises(KeyboardOutputError, match="No device"):
             await backend.connect()
 
 
 class TestUsbHidDisconnect:
     @pytest.mark.asyncio
-    async def test_disconnect_calls_close(self, backend: UsbHidKeyboardOutput, mock_writer: AsyncMock) -> None:
+    async def test_disconnect_calls_close(self, backend: UsbHidKeyboardOutput, writer: FakeHidWriter) -> None:
         await backend.disconnect()
-        mock_writer.close.assert_called_once()
+        assert writer.calls == [("close",)]
 
 
 class TestUsbHidSendKeystroke:
     @pytest.mark.asyncio
-    async def test_sends_keystroke(self, backend: UsbHidKeyboardOutput, mock_writer: AsyncMock) -> None:
+    async def test_sends_keystroke(self, backend: UsbHidKeyboardOutput, writer: FakeHidWriter) -> None:
         await backend.send_keystroke("Enter")
-        mock_writer.send_keystroke.assert_called_once_with("Enter")
+        assert writer.calls == [("send_keystroke", "Enter")]
 
     @pytest.mark.asyncio
-    async def test_wraps_value_error(self, backend: UsbHidKeyboardOutput, mock_writer: AsyncMock) -> None:
-        mock_writer.send_keystroke.side_effect = ValueError("Unknown key")
+    async def test_wraps_value_error(self, backend: UsbHidKeyboardOutput, writer: FakeHidWriter) -> None:
+        writer.errors["send_keystroke"] = ValueError("Unknown key")
         with pytest.raises(KeyboardOutputError):
             await backend.send_keystroke("BadKey")
 
 
 class TestUsbHidSendKeyCombo:
     @pytest.mark.asyncio
-    async def test_sends_combo(self, backend: UsbHidKeyboardOutput, mock_writer: AsyncMock) -> None:
+    async def test_sends_combo(self, backend: UsbHidKeyboardOutput, writer: FakeHidWriter) -> None:
         await backend.send_key_combo(["ctrl"], "c")
-        mock_writer.send_key_combo.assert_called_once_with(["ctrl"], "c")
+        assert writer.calls == [("send_key_combo", ["ctrl"], "c")]
 
     @pytest.mark.asyncio
-    async def test_wraps_error(self, backend: UsbHidKeyboardOutput, mock_writer: AsyncMock) -> None:
-        mock_writer.send_key_combo.side_effect = HidWriteError("I/O error")
+    async def test_wraps_error(self, backend: UsbHidKeyboardOutput, writer: FakeHidWriter) -> None:
+        writer.errors["send_key_combo"] = HidWriteError("I/O error")
         with pytest.raises(KeyboardOutputError):
             await backend.send_key_combo(["ctrl"], "c")
 
 
 class TestUsbHidSendText:
     @pytest.mark.asyncio
-    async def test_sends_text(self, backend: UsbHidKeyboardOutput, mock_writer: AsyncMock) -> None:
+    async def test_sends_text(self, backend: UsbHidKeyboardOutput, writer: FakeHidWriter) -> None:
         await backend.send_text("hello")
-        mock_writer.send_text.assert_called_once_with("hello")
+        assert writer.calls == [("send_text_bulk", "hello")]
 
     @pytest.mark.asyncio
-    async def test_wraps_error(self, backend: UsbHidKeyboardOutput, mock_writer: AsyncMock) -> None:
-        mock_writer.send_text.side_effect = ValueError("No mapping")
+    async def test_wraps_error(self, backend: UsbHidKeyboardOutput, writer: FakeHidWriter) -> None:
+        writer.errors["send_text_bulk"] = ValueError("No mapping")
         with pytest.raises(KeyboardOutputError):
             await backend.send_text("\x00")
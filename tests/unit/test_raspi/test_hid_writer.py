@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+import os
 
 import pytest
 
@@ -22,6 +22,40 @@ def writer() -> HidWriter:
     return HidWriter(device_path="/dev/hidg0")
 
 
+@pytest.fixture
+def write_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[int, bytes]]:
+    """Collect os.write calls as (fd, report) without mock machinery.
+
+    monkeypatch swaps in a plain function and restores it on teardown
+    — no MagicMock construction or call-args normalization per test,
+    and no side_effect dispatch frame on every captured write.
+    (Constructor injection of an os-like namespace into the writers
+    was considered instead, but that would add a test-only seam to the
+    production hot path for no further saving over these fixtures.)
+    """
+    calls: list[tuple[int, bytes]] = []
+
+    def fake_write(fd: int, data: bytes) -> int:
+        calls.append((fd, bytes(data)))
+        return len(data)
+
+    monkeypatch.setattr(os, "write", fake_write)
+    return calls
+
+
+@pytest.fixture
+def writev_reports(monkeypatch: pytest.MonkeyPatch) -> list[bytes]:
+    """Collect os.writev iovecs, flattened to one report per entry."""
+    reports: list[bytes] = []
+
+    def fake_writev(fd: int, iovecs: list) -> int:
+        reports.extend(bytes(iov) for iov in iovecs)
+        return sum(len(iov) for iov in iovecs)
+
+    monkeypatch.setattr(os, "writev", fake_writev)
+    return reports
+
+
 class TestHidWriterInit:
     def test_defaults(self, writer: HidWriter) -> None:
         assert writer._keypress_delay == DEFAULT_KEYPRESS_DELAY
@@ -36,32 +70,35 @@ class TestHidWriterInit:
 
 class TestHidWriterOpen:
     @pytest.mark.asyncio
-    async def test_open_sets_fd(self) -> None:
+    async def test_open_sets_fd(self, monkeypatch: pytest.MonkeyPatch) -> None:
         w = HidWriter()
-        with patch("os.open", return_value=42):
-            await w.open()
+        monkeypatch.setattr(os, "open", lambda *a, **k: 42)
+        await w.open()
         assert w._fd == 42
         assert w.is_open
         # Clean up without real close
         w._fd = None
 
     @pytest.mark.asyncio
-    async def test_open_failure_raises(self) -> None:
+    async def test_open_failure_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
         w = HidWriter(device_path="/dev/nonexistent")
-        with patch("os.open", side_effect=OSError("No such device")):
-            with pytest.raises(HidWriteError, match="Cannot open"):
-                await w.open()
+
+        def fail_open(*args: object, **kwargs: object) -> int:
+            raise OSError("No such device")
+
+        monkeypatch.setattr(os, "open", fail_open)
+        with pytest.raises(HidWriteError, match="Cannot open"):
+            await w.open()
         assert not w.is_open
 
 
 class TestHidWriterWrite:
     @pytest.mark.asyncio
-    async def test_write_report(self) -> None:
+    async def test_write_report(self, write_calls: list[tuple[int, bytes]]) -> None:
         w = HidWriter()
         w._fd = 42
-        with patch("os.write") as mock_write:
-            await w._write_report(b"\x00" * 8)
-            mock_write.assert_called_once_with(42, b"\x00" * 8)
+        await w._write_report(b"\x00" * 8)
+        assert write_calls == [(42, b"\x00" * 8)]
 
     @pytest.mark.asyncio
     async def test_write_report_wrong_length(self) -> None:
@@ -77,61 +114,103 @@ class TestHidWriterWrite:
             await w._write_report(b"\x00" * 8)
 
     @pytest.mark.asyncio
-    async def test_write_os_error(self) -> None:
+    async def test_write_os_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
         w = HidWriter()
         w._fd = 42
-        with patch("os.write", side_effect=OSError("I/O error")):
-            with pytest.raises(HidWriteError, match="Failed to write"):
-                await w._write_report(b"\x00" * 8)
+
+        def fail_write(fd: int, data: bytes) -> int:
+            raise OSError("I/O error")
+
+        monkeypatch.setattr(os, "write", fail_write)
+        with pytest.raises(HidWriteError, match="Failed to write"):
+            await w._write_report(b"\x00" * 8)
+
+    @pytest.mark.asyncio
+    async def test_write_report_short_write(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A short count from the gadget is retried with the remainder."""
+        w = HidWriter()
+        w._fd = 42
+        chunks: list[bytes] = []
+
+        def short_write(fd: int, data: bytes) -> int:
+            chunks.append(bytes(data))
+            return min(4, len(data))
+
+        monkeypatch.setattr(os, "write", short_write)
+        await w._write_report(b"\x01\x00\x04\x00\x00\x00\x00\x00")
+        assert chunks == [
+            b"\x01\x00\x04\x00\x00\x00\x00\x00",
+            b"\x00\x00\x00\x00",
+        ]
 
 
 class TestHidWriterKeys:
     @pytest.mark.asyncio
-    async def test_press_key(self) -> None:
+    async def test_press_key(self, write_calls: list[tuple[int, bytes]]) -> None:
         w = HidWriter()
         w._fd = 42
-        with patch("os.write") as mock_write:
-            await w.press_key(0x00, 0x28)  # Enter
-            expected = bytes([0x00, 0x00, 0x28, 0x00, 0x00, 0x00, 0x00, 0x00])
-            mock_write.assert_called_once_with(42, expected)
+        await w.press_key(0x00, 0x28)  # Enter
+        expected = bytes([0x00, 0x00, 0x28, 0x00, 0x00, 0x00, 0x00, 0x00])
+        assert write_calls == [(42, expected)]
 
     @pytest.mark.asyncio
-    async def test_release_keys(self) -> None:
+    async def test_release_keys(self, write_calls: list[tuple[int, bytes]]) -> None:
         w = HidWriter()
         w._fd = 42
-        with patch("os.write") as mock_write:
-            await w.release_keys()
-            mock_write.assert_called_once_with(42, RELEASE_REPORT)
+        await w.release_keys()
+        assert write_calls == [(42, RELEASE_REPORT)]
 
     @pytest.mark.asyncio
-    async def test_tap_key_press_then_release(self) -> None:
+    async def test_tap_key_press_then_release(
+        self, writev_reports: list[bytes]
+    ) -> None:
         w = HidWriter(keypress_delay=0.0)
         w._fd = 42
-        reports: list[bytes] = []
-        with patch("os.write", side_effect=lambda fd, data: reports.append(data)):
-            await w.tap_key(0x02, 0x04)  # Shift + a
+        # Zero delay: press+release leave in one writev
+        await w.tap_key(0x02, 0x04)  # Shift + a
+        reports = writev_reports
         assert len(reports) == 2
         assert reports[0] == bytes([0x02, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00])
         assert reports[1] == RELEASE_REPORT
 
     @pytest.mark.asyncio
-    async def test_send_keystroke_enter(self) -> None:
+    async def test_tap_key_short_writev_resends_release(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A short tap writev must not leave the key logically held."""
         w = HidWriter(keypress_delay=0.0)
         w._fd = 42
-        reports: list[bytes] = []
-        with patch("os.write", side_effect=lambda fd, data: reports.append(data)):
-            await w.send_keystroke("Enter")
+        resent: list[bytes] = []
+        monkeypatch.setattr(os, "writev", lambda fd, iovecs: 8)  # press only
+
+        def record_write(fd: int, data: bytes) -> int:
+            resent.append(bytes(data))
+            return len(data)
+
+        monkeypatch.setattr(os, "write", record_write)
+        await w.tap_key(0x00, 0x04)
+        assert resent == [RELEASE_REPORT]
+
+    @pytest.mark.asyncio
+    async def test_send_keystroke_enter(
+        self, writev_reports: list[bytes]
+    ) -> None:
+        w = HidWriter(keypress_delay=0.0)
+        w._fd = 42
+        await w.send_keystroke("Enter")
+        reports = writev_reports
         assert len(reports) == 2
         # First report should have Enter scan code (0x28)
         assert reports[0][2] == 0x28
 
     @pytest.mark.asyncio
-    async def test_send_keystroke_uppercase(self) -> None:
+    async def test_send_keystroke_uppercase(
+        self, writev_reports: list[bytes]
+    ) -> None:
         w = HidWriter(keypress_delay=0.0)
         w._fd = 42
-        reports: list[bytes] = []
-        with patch("os.write", side_effect=lambda fd, data: reports.append(data)):
-            await w.send_keystroke("A")
+        await w.send_keystroke("A")
+        reports = writev_reports
         assert len(reports) == 2
         # Shift modifier should be set
         assert reports[0][0] == 0x02
@@ -139,37 +218,111 @@ class TestHidWriterKeys:
         assert reports[0][2] == 0x04
 
     @pytest.mark.asyncio
-    async def test_send_key_combo_ctrl_c(self) -> None:
+    async def test_send_key_combo_ctrl_c(
+        self, writev_reports: list[bytes]
+    ) -> None:
         w = HidWriter(keypress_delay=0.0)
         w._fd = 42
-        reports: list[bytes] = []
-        with patch("os.write", side_effect=lambda fd, data: reports.append(data)):
-            await w.send_key_combo(["ctrl"], "c")
+        await w.send_key_combo(["ctrl"], "c")
+        reports = writev_reports
         assert len(reports) == 2
         assert reports[0][0] == 0x01  # Left Ctrl
         assert reports[0][2] == 0x06  # 'c' scan code
 
     @pytest.mark.asyncio
-    async def test_send_text(self) -> None:
+    async def test_send_text(self, writev_reports: list[bytes]) -> None:
+        # Zero pacing routes through the batched writev path.
         w = HidWriter(keypress_delay=0.0, inter_char_delay=0.0)
         w._fd = 42
-        reports: list[bytes] = []
-        with patch("os.write", side_effect=lambda fd, data: reports.append(data)):
-            await w.send_text("hi")
+        await w.send_text("hi")
         # 2 chars * (press + release) = 4 reports
-        assert len(reports) == 4
+        assert len(writev_reports) == 4
+
+    @pytest.mark.asyncio
+    async def test_send_text_batch_resubmits_short_writev(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A short inline writev hands the unsent tail to the helper."""
+        w = HidWriter(keypress_delay=0.0, inter_char_delay=0.0)
+        w._fd = 42
+        flat: list[bytes] = []
+        short_once = [True]
+
+        def short_writev(fd: int, iovecs: list) -> int:
+            data = b"".join(bytes(iov) for iov in iovecs)
+            n = 8 if short_once and short_once.pop() else len(data)
+            flat.append(data[:n])
+            return n
+
+        monkeypatch.setattr(os, "writev", short_writev)
+        await w.send_text("ab")
+        assert b"".join(flat) == bytes(w._build_text_reports("ab"))
+
+    @pytest.mark.asyncio
+    async def test_send_text_paced_writes_per_report(
+        self, write_calls: list[tuple[int, bytes]]
+    ) -> None:
+        w = HidWriter(keypress_delay=0.001, inter_char_delay=0.0)
+        w._fd = 42
+        await w.send_text("hi")
+        # Paced typing still sends one report per write
+        assert len(write_calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_send_text_bulk(self, writev_reports: list[bytes]) -> None:
+        w = HidWriter(keypress_delay=0.0, inter_char_delay=0.0)
+        w._fd = 42
+        await w.send_text_bulk("Hi")
+        # 2 chars * (press + release) = 4 reports
+        assert len(writev_reports) == 4
+        assert writev_reports[0][0] == 0x02  # 'H' needs shift
+        assert writev_reports[0][2] == 0x0B  # 'h' scan code
+        assert writev_reports[1] == RELEASE_REPORT
+        assert writev_reports[2][2] == 0x0C  # 'i' scan code
+
+    @pytest.mark.asyncio
+    async def test_send_text_bulk_resubmits_short_writev(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A short writev count must not drop the rest of the chunk."""
+        w = HidWriter(keypress_delay=0.0, inter_char_delay=0.0)
+        w._fd = 42
+        flat: list[bytes] = []
+        short_once = [True]
+
+        def short_writev(fd: int, iovecs: list) -> int:
+            data = b"".join(bytes(iov) for iov in iovecs)
+            n = 8 if short_once and short_once.pop() else len(data)
+            flat.append(data[:n])
+            return n
+
+        monkeypatch.setattr(os, "writev", short_writev)
+        await w.send_text_bulk("ab")
+        assert b"".join(flat) == bytes(w._build_text_reports("ab"))
+
+    @pytest.mark.asyncio
+    async def test_send_text_bulk_unmapped_char(
+        self, writev_reports: list[bytes]
+    ) -> None:
+        w = HidWriter(keypress_delay=0.0, inter_char_delay=0.0)
+        w._fd = 42
+        with pytest.raises(ValueError, match="No HID mapping"):
+            await w.send_text_bulk("a\x00b")
+        # Translation fails before anything is written
+        assert writev_reports == []
 
 
 class TestHidWriterContextManager:
     @pytest.mark.asyncio
-    async def test_context_manager(self) -> None:
+    async def test_context_manager(
+        self, monkeypatch: pytest.MonkeyPatch, write_calls: list[tuple[int, bytes]]
+    ) -> None:
         w = HidWriter()
-        with patch("os.open", return_value=42), \
-             patch("os.write"), \
-             patch("os.close"):
-            async with w:
-                assert w.is_open
-            assert not w.is_open
+        monkeypatch.setattr(os, "open", lambda *a, **k: 42)
+        monkeypatch.setattr(os, "close", lambda fd: None)
+        async with w:
+            assert w.is_open
+        assert not w.is_open
 
 
 # ===================================================================
@@ -194,31 +347,34 @@ class TestMouseHidWriterInit:
 
 class TestMouseHidWriterOpen:
     @pytest.mark.asyncio
-    async def test_open_sets_fd(self) -> None:
+    async def test_open_sets_fd(self, monkeypatch: pytest.MonkeyPatch) -> None:
         w = MouseHidWriter()
-        with patch("os.open", return_value=99):
-            await w.open()
+        monkeypatch.setattr(os, "open", lambda *a, **k: 99)
+        await w.open()
         assert w._fd == 99
         assert w.is_open
         w._fd = None
 
     @pytest.mark.asyncio
-    async def test_open_failure_raises(self) -> None:
+    async def test_open_failure_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
         w = MouseHidWriter(device_path="/dev/nonexistent")
-        with patch("os.open", side_effect=OSError("No such device")):
-            with pytest.raises(HidWriteError, match="Cannot open mouse"):
-                await w.open()
+
+        def fail_open(*args: object, **kwargs: object) -> int:
+            raise OSError("No such device")
+
+        monkeypatch.setattr(os, "open", fail_open)
+        with pytest.raises(HidWriteError, match="Cannot open mouse"):
+            await w.open()
         assert not w.is_open
 
 
 class TestMouseHidWriterWrite:
     @pytest.mark.asyncio
-    async def test_write_report(self) -> None:
+    async def test_write_report(self, write_calls: list[tuple[int, bytes]]) -> None:
         w = MouseHidWriter()
         w._fd = 99
-        with patch("os.write") as mock_write:
-            await w._write_report(b"\x00" * 4)
-            mock_write.assert_called_once_with(99, b"\x00" * 4)
+        await w._write_report(b"\x00" * 4)
+        assert write_calls == [(99, b"\x00" * 4)]
 
     @pytest.mark.asyncio
     async def test_write_report_wrong_length(self) -> None:
@@ -234,33 +390,35 @@ class TestMouseHidWriterWrite:
             await w._write_report(b"\x00" * 4)
 
     @pytest.mark.asyncio
-    async def test_write_os_error(self) -> None:
+    async def test_write_os_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
         w = MouseHidWriter()
         w._fd = 99
-        with patch("os.write", side_effect=OSError("I/O error")):
-            with pytest.raises(HidWriteError, match="Failed to write"):
-                await w._write_report(b"\x00" * 4)
+
+        def fail_write(fd: int, data: bytes) -> int:
+            raise OSError("I/O error")
+
+        monkeypatch.setattr(os, "write", fail_write)
+        with pytest.raises(HidWriteError, match="Failed to write"):
+            await w._write_report(b"\x00" * 4)
 
 
 class TestMouseHidWriterMove:
     @pytest.mark.asyncio
-    async def test_move(self) -> None:
+    async def test_move(self, write_calls: list[tuple[int, bytes]]) -> None:
         w = MouseHidWriter()
         w._fd = 99
-        reports: list[bytes] = []
-        with patch("os.write", side_effect=lambda fd, data: reports.append(data)):
-            await w.move(10, -5)
+        await w.move(10, -5)
+        reports = [data for _, data in write_calls]
         assert len(reports) == 1
         # [buttons=0, x=10, y=-5, wheel=0]
         assert reports[0] == b"\x00\x0a\xfb\x00"
 
     @pytest.mark.asyncio
-    async def test_move_clamps(self) -> None:
+    async def test_move_clamps(self, write_calls: list[tuple[int, bytes]]) -> None:
         w = MouseHidWriter()
         w._fd = 99
-        reports: list[bytes] = []
-        with patch("os.write", side_effect=lambda fd, data: reports.append(data)):
-            await w.move(200, -200)
+        await w.move(200, -200)
+        reports = [data for _, data in write_calls]
         assert len(reports) == 1
         # Clamped to 127 and -127
         assert reports[0] == b"\x00\x7f\x81\x00"
@@ -268,12 +426,11 @@ class TestMouseHidWriterMove:
 
 class TestMouseHidWriterClick:
     @pytest.mark.asyncio
-    async def test_click_left(self) -> None:
+    async def test_click_left(self, write_calls: list[tuple[int, bytes]]) -> None:
         w = MouseHidWriter()
         w._fd = 99
-        reports: list[bytes] = []
-        with patch("os.write", side_effect=lambda fd, data: reports.append(data)):
-            await w.click("left")
+        await w.click("left")
+        reports = [data for _, data in write_calls]
         assert len(reports) == 2
         # Press: buttons=LEFT(0x01)
         assert reports[0][0] == 0x01
@@ -281,12 +438,11 @@ class TestMouseHidWriterClick:
         assert reports[1][0] == 0x00
 
     @pytest.mark.asyncio
-    async def test_click_right(self) -> None:
+    async def test_click_right(self, write_calls: list[tuple[int, bytes]]) -> None:
         w = MouseHidWriter()
         w._fd = 99
-        reports: list[bytes] = []
-        with patch("os.write", side_effect=lambda fd, data: reports.append(data)):
-            await w.click("right")
+        await w.click("right")
+        reports = [data for _, data in write_calls]
         assert len(reports) == 2
         assert reports[0][0] == 0x02
 
@@ -300,23 +456,21 @@ class TestMouseHidWriterClick:
 
 class TestMouseHidWriterScroll:
     @pytest.mark.asyncio
-    async def test_scroll(self) -> None:
+    async def test_scroll(self, write_calls: list[tuple[int, bytes]]) -> None:
         w = MouseHidWriter()
         w._fd = 99
-        reports: list[bytes] = []
-        with patch("os.write", side_effect=lambda fd, data: reports.append(data)):
-            await w.scroll(-3)
+        await w.scroll(-3)
+        reports = [data for _, data in write_calls]
         assert len(reports) == 1
         # [buttons=0, x=0, y=0, wheel=-3]
         assert reports[0] == b"\x00\x00\x00\xfd"
 
     @pytest.mark.asyncio
-    async def test_scroll_clamps(self) -> None:
+    async def test_scroll_clamps(self, write_calls: list[tuple[int, bytes]]) -> None:
         w = MouseHidWriter()
         w._fd = 99
-        reports: list[bytes] = []
-        with patch("os.write", side_effect=lambda fd, data: reports.append(data)):
-            await w.scroll(200)
+        await w.scroll(200)
+        reports = [data for _, data in write_calls]
         assert len(reports) == 1
         # Clamped to 127
         assert reports[0] == b"\x00\x00\x00\x7f"
@@ -324,11 +478,12 @@ class TestMouseHidWriterScroll:
 
 class TestMouseHidWriterContextManager:
     @pytest.mark.asyncio
-    async def test_context_manager(self) -> None:
+    async def test_context_manager(
+        self, monkeypatch: pytest.MonkeyPatch, write_calls: list[tuple[int, bytes]]
+    ) -> None:
         w = MouseHidWriter()
-        with patch("os.open", return_value=99), \
-             patch("os.write"), \
-             patch("os.close"):
-            async with w:
-                assert w.is_open
-            assert not w.is_open
+        monkeypatch.setattr(os, "open", lambda *a, **k: 99)
+        monkeypatch.setattr(os, "close", lambda fd: None)
+        async with w:
+            assert w.is_open
+        assert not w.is_open
@@ -2,24 +2,29 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
 
 from terminaleyes.raspi.hid_writer import HidWriteError, HidWriter, MouseHidWriter
 from terminaleyes.raspi.server import create_app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_writer() -> AsyncMock:
-    """A mock HidWriter with all async methods stubbed."""
+    """A mock HidWriter with all async methods stubbed.
+
+    spec= is kept deliberately: with module scope the spec
+    introspection runs once per module, so dropping it would save
+    nothing per test while losing typo detection on method names.
+    """
     writer = AsyncMock(spec=HidWriter)
     writer.is_open = True
     return writer
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_mouse_writer() -> AsyncMock:
     """A mock MouseHidWriter with all async methods stubbed."""
     writer = AsyncMock(spec=MouseHidWriter)
@@ -27,7 +32,7 @@ def mock_mouse_writer() -> AsyncMock:
     return writer
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_bt_hid() -> AsyncMock:
     """A mock BluetoothHidServer with keyboard + mouse methods."""
     bt = AsyncMock()
@@ -35,20 +40,38 @@ def mock_bt_hid() -> AsyncMock:
     return bt
 
 
-@pytest.fixture
-def client(mock_writer: AsyncMock, mock_mouse_writer: AsyncMock) -> TestClient:
-    """A test client with mock HidWriter + MouseHidWriter injected (no BT)."""
+@pytest.fixture(scope="module")
+async def client(
+    mock_writer: AsyncMock, mock_mouse_writer: AsyncMock
+) -> httpx.AsyncClient:
+    """An in-loop ASGI client with mock HID writers injected (no BT).
+
+    ASGITransport drives the app directly on the test's event loop —
+    no TestClient portal thread or blocking queue hop per request.
+    With module scope each app is built exactly once per run, so a
+    single import-time app with FastAPI dependency_overrides would
+    save nothing further here — and the server wires writers through
+    create_app kwargs + app.state by design, not Depends.
+
+    Module scope (not session) is deliberate: the pytest-asyncio loop
+    is module-scoped and xdist distributes work per module, so a
+    session-wide client would need a session loop yet still be rebuilt
+    in every worker — same cost, more coupling.
+    """
     app = create_app(writer=mock_writer, mouse_writer=mock_mouse_writer, enable_bt_hid=False)
     app.state.writer = mock_writer
     app.state.mouse_writer = mock_mouse_writer
-    return TestClient(app)
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
 
 
-@pytest.fixture
-def client_with_bt(
+@pytest.fixture(scope="module")
+async def client_with_bt(
     mock_writer: AsyncMock, mock_mouse_writer: AsyncMock, mock_bt_hid: AsyncMock
-) -> TestClient:
-    """A test client with mock HidWriter, MouseHidWriter, and BT HID."""
+) -> httpx.AsyncClient:
+    """An in-loop ASGI client with mock HID writers and BT HID."""
     app = create_app(
         writer=mock_writer,
         mouse_writer=mock_mouse_writer,
@@ -58,16 +81,174 @@ def client_with_bt(
     app.state.writer = mock_writer
     app.state.mouse_writer = mock_mouse_writer
     app.state.bt_hid = mock_bt_hid
-    return TestClient(app)
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(
+    mock_writer: AsyncMock, mock_mouse_writer: AsyncMock, mock_bt_hid: AsyncMock
+) -> None:
+    """Clear call history and injected side effects between tests.
+
+    The mocks (and the clients built on them) are module-scoped so
+    app construction and client setup are paid once per module; this
+    per-test reset restores the isolation function scoping gave.
+    """
+    yield
+    for m in (mock_writer, mock_mouse_writer, mock_bt_hid):
+        m.reset_mock(return_value=True, side_effect=True)
+
+
+# ===================================================================
+# Success paths (parametrized)
+#
+# Every success case is structurally identical — POST json, expect
+# 200 + status "ok", expect exactly one recorded call on the right
+# mock method — so they share one parametrized test per client and
+# amortize fixture resolution across the whole table.
+# Tuple shape: (path, payload, method, expected (args, kwargs) of the
+# single mock call, extra response fields to assert).
+# ===================================================================
+
+USB_SUCCESS_CASES = [
+    pytest.param(
+        "/keystroke", {"key": "Enter"},
+        "mock_writer", "send_keystroke", (("Enter",), {}), {},
+        id="keystroke",
+    ),
+    pytest.param(
+        "/key-combo", {"modifiers": ["ctrl"], "key": "c"},
+        "mock_writer", "send_key_combo", ((["ctrl"], "c"), {}), {},
+        id="key-combo",
+    ),
+    pytest.param(
+        "/text", {"text": "hello world"},
+        "mock_writer", "send_text", (("hello world",), {}), {"length": "11"},
+        id="text",
+    ),
+    pytest.param(
+        "/text", {"text": ""},
+        "mock_writer", "send_text", (("",), {}), {"length": "0"},
+        id="text-empty",
+    ),
+    pytest.param(
+        "/mouse/move", {"x": 10, "y": -5},
+        "mock_mouse_writer", "move", ((10, -5), {}), {"x": "10", "y": "-5"},
+        id="mouse-move",
+    ),
+    pytest.param(
+        "/mouse/click", {"button": "left"},
+        "mock_mouse_writer", "click", (("left",), {}), {},
+        id="mouse-click",
+    ),
+    pytest.param(
+        "/mouse/scroll", {"amount": -3},
+        "mock_mouse_writer", "scroll", ((-3,), {}), {"amount": "-3"},
+        id="mouse-scroll",
+    ),
+]
+
+BT_SUCCESS_CASES = [
+    pytest.param(
+        "/bt/keystroke", {"key": "Enter"},
+        "send_keystroke", (("Enter",), {}),
+        {"key": "Enter", "transport": "bluetooth"},
+        id="bt-keystroke",
+    ),
+    pytest.param(
+        "/bt/key-combo", {"modifiers": ["ctrl"], "key": "c"},
+        "send_key_combo", ((["ctrl"], "c"), {}),
+        {"transport": "bluetooth"},
+        id="bt-key-combo",
+    ),
+    pytest.param(
+        "/bt/text", {"text": "hello world"},
+        # The handler forwards warmup (default True) as a keyword.
+        "send_text", (("hello world",), {"warmup": True}),
+        {"length": "11", "transport": "bluetooth"},
+        id="bt-text",
+    ),
+    pytest.param(
+        "/bt/mouse/move", {"x": 10, "y": -5},
+        "move", ((10, -5), {}), {"x": "10", "y": "-5"},
+        id="bt-mouse-move",
+    ),
+    pytest.param(
+        "/bt/mouse/click", {"button": "left"},
+        "click", (("left",), {}), {},
+        id="bt-mouse-click-left",
+    ),
+    pytest.param(
+        "/bt/mouse/click", {"button": "right"},
+        "click", (("right",), {}), {},
+        id="bt-mouse-click-right",
+    ),
+    pytest.param(
+        "/bt/mouse/scroll", {"amount": -3},
+        "scroll", ((-3,), {}), {"amount": "-3"},
+        id="bt-mouse-scroll",
+    ),
+]
+
+
+class TestEndpointSuccess:
+    @pytest.mark.parametrize(
+        ("path", "payload", "mock_name", "method", "expected_call", "extra_fields"),
+        USB_SUCCESS_CASES,
+    )
+    async def test_usb_endpoint_success(
+        self,
+        client: httpx.AsyncClient,
+        request: pytest.FixtureRequest,
+        path: str,
+        payload: dict,
+        mock_name: str,
+        method: str,
+        expected_call: tuple,
+        extra_fields: dict,
+    ) -> None:
+        resp = await client.post(path, json=payload)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["status"] == "ok"
+        for field, value in extra_fields.items():
+            assert data[field] == value
+        mock = request.getfixturevalue(mock_name)
+        assert getattr(mock, method).call_args_list == [expected_call]
+
+    @pytest.mark.parametrize(
+        ("path", "payload", "method", "expected_call", "extra_fields"),
+        BT_SUCCESS_CASES,
+    )
+    async def test_bt_endpoint_success(
+        self,
+        client_with_bt: httpx.AsyncClient,
+        mock_bt_hid: AsyncMock,
+        path: str,
+        payload: dict,
+        method: str,
+        expected_call: tuple,
+        extra_fields: dict,
+    ) -> None:
+        resp = await client_with_bt.post(path, json=payload)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["status"] == "ok"
+        for field, value in extra_fields.items():
+            assert data[field] == value
+        assert getattr(mock_bt_hid, method).call_args_list == [expected_call]
 
 
 # ===================================================================
-# USB HID keyboard endpoints
+# Health
 # ===================================================================
 
 class TestHealthEndpoint:
-    def test_health_returns_ok(self, client: TestClient) -> None:
-        resp = client.get("/health")
+    async def test_health_returns_ok(self, client: httpx.AsyncClient) -> None:
+        resp = await client.get("/health")
         assert resp.status_code == 200
         data = resp.json()
         assert data["status"] == "ok"
@@ -75,255 +256,158 @@ class TestHealthEndpoint:
         assert data["mouse_hid_open"] is True
 
 
-class TestKeystrokeEndpoint:
-    def test_keystroke_success(self, client: TestClient, mock_writer: AsyncMock) -> None:
-        resp = client.post("/keystroke", json={"key": "Enter"})
-        assert resp.status_code == 200
-        assert resp.json()["status"] == "ok"
-        mock_writer.send_keystroke.assert_called_once_with("Enter")
+# ===================================================================
+# USB HID keyboard endpoints — error paths
+# ===================================================================
 
-    def test_keystroke_unknown_key(self, client: TestClient, mock_writer: AsyncMock) -> None:
+class TestKeystrokeEndpoint:
+    async def test_keystroke_unknown_key(self, client: httpx.AsyncClient, mock_writer: AsyncMock) -> None:
         mock_writer.send_keystroke.side_effect = ValueError("Unknown key")
-        resp = client.post("/keystroke", json={"key": "BadKey"})
+        resp = await client.post("/keystroke", json={"key": "BadKey"})
         assert resp.status_code == 400
 
-    def test_keystroke_missing_field(self, client: TestClient) -> None:
-        resp = client.post("/keystroke", json={})
+    async def test_keystroke_missing_field(self, client: httpx.AsyncClient) -> None:
+        resp = await client.post("/keystroke", json={})
         assert resp.status_code == 422
 
 
 class TestKeyComboEndpoint:
-    def test_key_combo_success(self, client: TestClient, mock_writer: AsyncMock) -> None:
-        resp = client.post("/key-combo", json={"modifiers": ["ctrl"], "key": "c"})
-        assert resp.status_code == 200
-        assert resp.json()["status"] == "ok"
-        mock_writer.send_key_combo.assert_called_once_with(["ctrl"], "c")
-
-    def test_key_combo_bad_modifier(self, client: TestClient, mock_writer: AsyncMock) -> None:
+    async def test_key_combo_bad_modifier(self, client: httpx.AsyncClient, mock_writer: AsyncMock) -> None:
         mock_writer.send_key_combo.side_effect = ValueError("Unknown modifier")
-        resp = client.post("/key-combo", json={"modifiers": ["banana"], "key": "c"})
+        resp = await client.post("/key-combo", json={"modifiers": ["banana"], "key": "c"})
         assert resp.status_code == 400
 
 
-class TestTextEndpoint:
-    def test_text_success(self, client: TestClient, mock_writer: AsyncMock) -> None:
-        resp = client.post("/text", json={"text": "hello world"})
+class TestBatchEndpoint:
+    async def test_batch_runs_actions_in_order(
+        self, client: httpx.AsyncClient, mock_writer: AsyncMock
+    ) -> None:
+        resp = await client.post(
+            "/batch",
+            json={
+                "actions": [
+                    {"op": "text", "text": "ls -la"},
+                    {"op": "key", "key": "Enter"},
+                ]
+            },
+        )
         assert resp.status_code == 200
-        data = resp.json()
-        assert data["status"] == "ok"
-        assert data["length"] == "11"
-        mock_writer.send_text.assert_called_once_with("hello world")
+        assert resp.json()["actions"] == "2"
+        assert mock_writer.send_text.call_args_list == [(("ls -la",), {})]
+        assert mock_writer.send_keystroke.call_args_list == [(("Enter",), {})]
 
-    def test_text_empty(self, client: TestClient, mock_writer: AsyncMock) -> None:
-        resp = client.post("/text", json={"text": ""})
-        assert resp.status_code == 200
-        mock_writer.send_text.assert_called_once_with("")
+    async def test_batch_invalid_op(self, client: httpx.AsyncClient, mock_writer: AsyncMock) -> None:
+        resp = await client.post("/batch", json={"actions": [{"op": "dance"}]})
+        assert resp.status_code == 400
 
 
 # ===================================================================
-# USB HID mouse endpoints
+# USB HID mouse endpoints — error paths
 # ===================================================================
 
 class TestMouseMoveEndpoint:
-    def test_mouse_move_success(
-        self, client: TestClient, mock_mouse_writer: AsyncMock
-    ) -> None:
-        resp = client.post("/mouse/move", json={"x": 10, "y": -5})
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["status"] == "ok"
-        assert data["x"] == "10"
-        assert data["y"] == "-5"
-        mock_mouse_writer.move.assert_called_once_with(10, -5)
-
-    def test_mouse_move_error(
-        self, client: TestClient, mock_mouse_writer: AsyncMock
+    async def test_mouse_move_error(
+        self, client: httpx.AsyncClient, mock_mouse_writer: AsyncMock
     ) -> None:
         mock_mouse_writer.move.side_effect = HidWriteError("I/O error")
-        resp = client.post("/mouse/move", json={"x": 10, "y": 0})
+        resp = await client.post("/mouse/move", json={"x": 10, "y": 0})
         assert resp.status_code == 400
 
 
 class TestMouseClickEndpoint:
-    def test_mouse_click_success(
-        self, client: TestClient, mock_mouse_writer: AsyncMock
-    ) -> None:
-        resp = client.post("/mouse/click", json={"button": "left"})
-        assert resp.status_code == 200
-        assert resp.json()["status"] == "ok"
-        mock_mouse_writer.click.assert_called_once_with("left")
-
-    def test_mouse_click_bad_button(
-        self, client: TestClient, mock_mouse_writer: AsyncMock
+    async def test_mouse_click_bad_button(
+        self, client: httpx.AsyncClient, mock_mouse_writer: AsyncMock
     ) -> None:
         mock_mouse_writer.click.side_effect = ValueError("Unknown button")
-        resp = client.post("/mouse/click", json={"button": "banana"})
+        resp = await client.post("/mouse/click", json={"button": "banana"})
         assert resp.status_code == 400
 
-    def test_mouse_click_error(
-        self, client: TestClient, mock_mouse_writer: AsyncMock
+    async def test_mouse_click_error(
+        self, client: httpx.AsyncClient, mock_mouse_writer: AsyncMock
     ) -> None:
         mock_mouse_writer.click.side_effect = HidWriteError("I/O error")
-        resp = client.post("/mouse/click", json={"button": "right"})
+        resp = await client.post("/mouse/click", json={"button": "right"})
         assert resp.status_code == 400
 
 
 class TestMouseScrollEndpoint:
-    def test_mouse_scroll_success(
-        self, client: TestClient, mock_mouse_writer: AsyncMock
-    ) -> None:
-        resp = client.post("/mouse/scroll", json={"amount": -3})
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["status"] == "ok"
-        assert data["amount"] == "-3"
-        mock_mouse_writer.scroll.assert_called_once_with(-3)
-
-    def test_mouse_scroll_error(
-        self, client: TestClient, mock_mouse_writer: AsyncMock
+    async def test_mouse_scroll_error(
+        self, client: httpx.AsyncClient, mock_mouse_writer: AsyncMock
     ) -> None:
         mock_mouse_writer.scroll.side_effect = HidWriteError("I/O error")
-        resp = client.post("/mouse/scroll", json={"amount": 5})
+        resp = await client.post("/mouse/scroll", json={"amount": 5})
         assert resp.status_code == 400
 
 
 # ===================================================================
-# Bluetooth keyboard endpoints
+# Bluetooth keyboard endpoints — error / no-BT paths
 # ===================================================================
 
 class TestBtKeystrokeEndpoint:
-    def test_bt_keystroke_success(
-        self, client_with_bt: TestClient, mock_bt_hid: AsyncMock
-    ) -> None:
-        resp = client_with_bt.post("/bt/keystroke", json={"key": "Enter"})
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["status"] == "ok"
-        assert data["key"] == "Enter"
-        assert data["transport"] == "bluetooth"
-        mock_bt_hid.send_keystroke.assert_called_once_with("Enter")
-
-    def test_bt_keystroke_no_bt(self, client: TestClient) -> None:
-        resp = client.post("/bt/keystroke", json={"key": "Enter"})
+    async def test_bt_keystroke_no_bt(self, client: httpx.AsyncClient) -> None:
+        resp = await client.post("/bt/keystroke", json={"key": "Enter"})
         assert resp.status_code == 503
 
-    def test_bt_keystroke_error(
-        self, client_with_bt: TestClient, mock_bt_hid: AsyncMock
+    async def test_bt_keystroke_error(
+        self, client_with_bt: httpx.AsyncClient, mock_bt_hid: AsyncMock
     ) -> None:
         mock_bt_hid.send_keystroke.side_effect = ValueError("Unknown key")
-        resp = client_with_bt.post("/bt/keystroke", json={"key": "BadKey"})
+        resp = await client_with_bt.post("/bt/keystroke", json={"key": "BadKey"})
         assert resp.status_code == 400
 
 
 class TestBtKeyComboEndpoint:
-    def test_bt_key_combo_success(
-        self, client_with_bt: TestClient, mock_bt_hid: AsyncMock
-    ) -> None:
-        resp = client_with_bt.post("/bt/key-combo", json={"modifiers": ["ctrl"], "key": "c"})
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["status"] == "ok"
-        assert data["transport"] == "bluetooth"
-        mock_bt_hid.send_key_combo.assert_called_once_with(["ctrl"], "c")
-
-    def test_bt_key_combo_no_bt(self, client: TestClient) -> None:
-        resp = client.post("/bt/key-combo", json={"modifiers": ["ctrl"], "key": "c"})
+    async def test_bt_key_combo_no_bt(self, client: httpx.AsyncClient) -> None:
+        resp = await client.post("/bt/key-combo", json={"modifiers": ["ctrl"], "key": "c"})
         assert resp.status_code == 503
 
-    def test_bt_key_combo_error(
-        self, client_with_bt: TestClient, mock_bt_hid: AsyncMock
+    async def test_bt_key_combo_error(
+        self, client_with_bt: httpx.AsyncClient, mock_bt_hid: AsyncMock
     ) -> None:
         mock_bt_hid.send_key_combo.side_effect = ValueError("Unknown modifier")
-        resp = client_with_bt.post("/bt/key-combo", json={"modifiers": ["banana"], "key": "c"})
+        resp = await client_with_bt.post("/bt/key-combo", json={"modifiers": ["banana"], "key": "c"})
         assert resp.status_code == 400
 
 
 class TestBtTextEndpoint:
-    def test_bt_text_success(
-        self, client_with_bt: TestClient, mock_bt_hid: AsyncMock
-    ) -> None:
-        resp = client_with_bt.post("/bt/text", json={"text": "hello world"})
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["status"] == "ok"
-        assert data["length"] == "11"
-        assert data["transport"] == "bluetooth"
-        mock_bt_hid.send_text.assert_called_once_with("hello world")
-
-    def test_bt_text_no_bt(self, client: TestClient) -> None:
-        resp = client.post("/bt/text", json={"text": "hello"})
+    async def test_bt_text_no_bt(self, client: httpx.AsyncClient) -> None:
+        resp = await client.post("/bt/text", json={"text": "hello"})
         assert resp.status_code == 503
 
 
 # ===================================================================
-# Bluetooth mouse endpoints
+# Bluetooth mouse endpoints — error / no-BT paths
 # ===================================================================
 
 class TestBtMouseMoveEndpoint:
-    def test_bt_mouse_move_success(
-        self, client_with_bt: TestClient, mock_bt_hid: AsyncMock
-    ) -> None:
-        resp = client_with_bt.post("/bt/mouse/move", json={"x": 10, "y": -5})
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["status"] == "ok"
-        assert data["x"] == "10"
-        assert data["y"] == "-5"
-        mock_bt_hid.move.assert_called_once_with(10, -5)
-
-    def test_bt_mouse_move_no_bt(self, client: TestClient) -> None:
-        resp = client.post("/bt/mouse/move", json={"x": 10, "y": 0})
+    async def test_bt_mouse_move_no_bt(self, client: httpx.AsyncClient) -> None:
+        resp = await client.post("/bt/mouse/move", json={"x": 10, "y": 0})
         assert resp.status_code == 503
 
-    def test_bt_mouse_move_error(
-        self, client_with_bt: TestClient, mock_bt_hid: AsyncMock
+    async def test_bt_mouse_move_error(
+        self, client_with_bt: httpx.AsyncClient, mock_bt_hid: AsyncMock
     ) -> None:
         mock_bt_hid.move.side_effect = Exception("BT disconnected")
-        resp = client_with_bt.post("/bt/mouse/move", json={"x": 10, "y": 0})
+        resp = await client_with_bt.post("/bt/mouse/move", json={"x": 10, "y": 0})
         assert resp.status_code == 400
 
 
 class TestBtMouseClickEndpoint:
-    def test_bt_mouse_click_success(
-        self, client_with_bt: TestClient, mock_bt_hid: AsyncMock
-    ) -> None:
-        resp = client_with_bt.post("/bt/mouse/click", json={"button": "left"})
-        assert resp.status_code == 200
-        assert resp.json()["status"] == "ok"
-        mock_bt_hid.click.assert_called_once_with("left")
-
-    def test_bt_mouse_click_right(
-        self, client_with_bt: TestClient, mock_bt_hid: AsyncMock
-    ) -> None:
-        resp = client_with_bt.post("/bt/mouse/click", json={"button": "right"})
-        assert resp.status_code == 200
-        mock_bt_hid.click.assert_called_once_with("right")
-
-    def test_bt_mouse_click_no_bt(self, client: TestClient) -> None:
-        resp = client.post("/bt/mouse/click", json={"button": "left"})
+    async def test_bt_mouse_click_no_bt(self, client: httpx.AsyncClient) -> None:
+        resp = await client.post("/bt/mouse/click", json={"button": "left"})
         assert resp.status_code == 503
 
-    def test_bt_mouse_click_bad_button(
-        self, client_with_bt: TestClient, mock_bt_hid: AsyncMock
+    async def test_bt_mouse_click_bad_button(
+        self, client_with_bt: httpx.AsyncClient, mock_bt_hid: AsyncMock
     ) -> None:
         mock_bt_hid.click.side_effect = ValueError("Unknown button")
-        resp = client_with_bt.post("/bt/mouse/click", json={"button": "banana"})
+        resp = await client_with_bt.post("/bt/mouse/click", json={"button": "banana"})
         assert resp.status_code == 400
 
 
 class TestBtMouseScrollEndpoint:
-    def test_bt_mouse_scroll_success(
-        self, client_with_bt: TestClient, mock_bt_hid: AsyncMock
-    ) -> None:
-        resp = client_with_bt.post("/bt/mouse/scroll", json={"amount": -3})
-        assert resp.status_code == 200
-        data = resp.json()
-        assert data["status"] == "ok"
-        assert data["amount"] == "-3"
-        mock_bt_hid.scroll.assert_called_once_with(-3)
-
-    def test_bt_mouse_scroll_no_bt(self, client: TestClient) -> None:
-        resp = client.post("/bt/mouse/scroll", json={"amount": 5})
+    async def test_bt_mouse_scroll_no_bt(self, client: httpx.AsyncClient) -> None:
+        resp = await client.post("/bt/mouse/scroll", json={"amount": 5})
         assert resp.status_code == 503
 
 
@@ -332,14 +416,14 @@ class TestBtMouseScrollEndpoint:
 # ===================================================================
 
 class TestHealthWithBt:
-    def test_health_shows_bt_connected(self, client_with_bt: TestClient) -> None:
-        resp = client_with_bt.get("/health")
+    async def test_health_shows_bt_connected(self, client_with_bt: httpx.AsyncClient) -> None:
+        resp = await client_with_bt.get("/health")
         assert resp.status_code == 200
         data = resp.json()
         assert data["bt_hid_connected"] is True
 
-    def test_health_no_bt(self, client: TestClient) -> None:
-        resp = client.get("/health")
+    async def test_health_no_bt(self, client: httpx.AsyncClient) -> None:
+        resp = await client.get("/health")
         assert resp.status_code == 200
         data = resp.json()
         assert data["bt_hid_connected"] is False